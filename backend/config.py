@@ -6,11 +6,97 @@ and .env files, providing type-safe access to all application settings.
 """
 
 import os
+from enum import IntFlag
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
-from pydantic import AliasChoices, Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AliasChoices, Field, PrivateAttr, field_validator
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+
+class EnvironmentFlag(IntFlag):
+    """Environment classification resolved once from ``manity_env``."""
+
+    NONE = 0
+    DEV = 1
+    PROD = 2
+    TEST = 4
+    PROTECTED = PROD | TEST
+
+
+_ENVIRONMENT_FLAGS = {
+    "dev": EnvironmentFlag.DEV,
+    "development": EnvironmentFlag.DEV,
+    "prod": EnvironmentFlag.PROD,
+    "production": EnvironmentFlag.PROD,
+    "test": EnvironmentFlag.TEST,
+    "testing": EnvironmentFlag.TEST,
+}
+
+_TRUE_VALUES = frozenset({"true", "yes", "1", "on"})
+_FALSE_VALUES = frozenset({"false", "no", "0", "off", ""})
+
+
+# Fields read from more than one environment variable, in priority order
+_ENV_ALIASES = {
+    "manity_admin_token": ("MANITY_ADMIN_TOKEN", "ADMIN_KEY"),
+    "manity_env": ("MANITY_ENV", "ENVIRONMENT"),
+}
+
+
+DEFAULT_ENV_FILE = ".env"
+
+
+class _DefaultEnvFile(tuple):
+    """Empty env_file list marking "no _env_file was passed to Settings()"."""
+
+
+# Stands in for model_config.env_file: the stock dotenv source reads nothing for it,
+# and settings_customise_sources swaps in DEFAULT_ENV_FILE only when it is still
+# this object, so an explicit _env_file (including None) is honoured.
+_DEFAULT_ENV_FILE_SENTINEL = _DefaultEnvFile()
+
+# Parsed .env contents keyed by resolved path, invalidated when the file's mtime changes
+_DOTENV_CACHE: dict[Path, tuple[float, Mapping[str, Optional[str]]]] = {}
+
+
+class _CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """DotEnv source that parses each .env file once instead of on every Settings()."""
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, Optional[str]]:
+        resolved_path = file_path.resolve()
+        mtime = resolved_path.stat().st_mtime
+        cached = _DOTENV_CACHE.get(resolved_path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, super()._read_env_file(file_path))
+            _DOTENV_CACHE[resolved_path] = cached
+        return cached[1]
+
+
+class _AliasedEnvSettingsSource(EnvSettingsSource):
+    """
+    Env source that looks aliased fields up directly in the variables it just read.
+
+    Built on every Settings(), so it follows environment changes made before
+    ``get_settings.cache_clear()``, without the generic per-alias field scan.
+    """
+
+    def get_field_value(self, field, field_name: str):
+        aliases = _ENV_ALIASES.get(field_name)
+        if aliases is None:
+            return super().get_field_value(field, field_name)
+        for alias in aliases:
+            env_val = self.env_vars.get(alias if self.case_sensitive else alias.lower())
+            if env_val is not None:
+                return env_val, alias, False
+        return None, aliases[0], False
 
 
 class Settings(BaseSettings):
@@ -21,13 +107,36 @@ class Settings(BaseSettings):
     Boolean values accept: true/false, yes/no, 1/0, on/off (case-insensitive).
     """
 
+    # env_file is an empty sentinel so pydantic-settings' own dotenv source never
+    # touches disk; DEFAULT_ENV_FILE is read through the cached source below instead.
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=_DEFAULT_ENV_FILE_SENTINEL,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
+        ignored_types=(cached_property,),
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Keep the default source order but resolve env aliases and read .env through the parse cache."""
+        env_file = getattr(dotenv_settings, "env_file", None)
+        cached_dotenv_settings = _CachedDotEnvSettingsSource(
+            settings_cls,
+            env_file=DEFAULT_ENV_FILE if env_file is _DEFAULT_ENV_FILE_SENTINEL else env_file,
+            env_file_encoding=dotenv_settings.env_file_encoding,
+        )
+        aliased_env_settings = _AliasedEnvSettingsSource(settings_cls)
+        return init_settings, aliased_env_settings, cached_dotenv_settings, file_secret_settings
+
     # ========================================================================
     # Database Configuration
     # ========================================================================
@@ -101,7 +210,7 @@ class Settings(BaseSettings):
 
     manity_admin_token: Optional[str] = Field(
         default=None,
-        validation_alias=AliasChoices("manity_admin_token", "MANITY_ADMIN_TOKEN", "ADMIN_KEY"),
+        validation_alias=AliasChoices(*_ENV_ALIASES["manity_admin_token"]),
         description="Admin authentication token for protected endpoints",
     )
 
@@ -111,7 +220,7 @@ class Settings(BaseSettings):
 
     manity_env: str = Field(
         default="development",
-        validation_alias=AliasChoices("manity_env", "MANITY_ENV", "ENVIRONMENT"),
+        validation_alias=AliasChoices(*_ENV_ALIASES["manity_env"]),
         description="Application environment: development, production, test, etc.",
     )
 
@@ -142,7 +251,7 @@ class Settings(BaseSettings):
     @classmethod
     def strip_trailing_slash(cls, v: Optional[str]) -> Optional[str]:
         """Remove trailing slashes from URLs."""
-        if v:
+        if v and v.endswith("/"):
             return v.rstrip("/")
         return v
 
@@ -162,53 +271,76 @@ class Settings(BaseSettings):
         if isinstance(v, bool):
             return v
         if isinstance(v, str):
-            v_lower = v.lower().strip()
-            if v_lower in ("true", "yes", "1", "on"):
+            v_lower = v.strip().lower()
+            if v_lower in _TRUE_VALUES:
                 return True
-            if v_lower in ("false", "no", "0", "off", ""):
+            if v_lower in _FALSE_VALUES:
                 return False
         return bool(v)
 
+    @classmethod
+    def fast_load(cls, **overrides) -> "Settings":
+        """
+        Build settings from the cached instance without running validators.
+
+        Overrides are used as-is, so pass already-normalized values
+        (e.g. lowercase environment names, URLs without trailing slashes).
+        """
+        return cls.model_construct(**{**get_settings().model_dump(), **overrides})
+
     # ========================================================================
     # Helper Properties
     # ========================================================================
 
+    _env_flag: EnvironmentFlag = PrivateAttr(default=EnvironmentFlag.NONE)
+    _database_url_from_env: bool = PrivateAttr(default=False)
+    _default_db_path: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        """Resolve values derived from validated fields once per instance."""
+        self._env_flag = _ENVIRONMENT_FLAGS.get(self.manity_env, EnvironmentFlag.NONE)
+        self._database_url_from_env = "DATABASE_URL" in os.environ
+        self._default_db_path = (
+            self.default_prod_db_path if self.is_production else self.default_dev_db_path
+        )
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.manity_env in {"prod", "production"}
+        return bool(self._env_flag & EnvironmentFlag.PROD)
 
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.manity_env in {"dev", "development"}
+        return bool(self._env_flag & EnvironmentFlag.DEV)
 
     @property
     def is_testing(self) -> bool:
         """Check if running in test environment."""
-        return self.manity_env in {"test", "testing"}
+        return bool(self._env_flag & EnvironmentFlag.TEST)
 
     @property
     def is_protected_environment(self) -> bool:
         """Check if running in a protected environment (prod, test)."""
-        return self.manity_env in {"prod", "production", "test", "testing"}
+        return bool(self._env_flag & EnvironmentFlag.PROTECTED)
 
     @property
     def default_db_path(self) -> str:
         """Get the appropriate default database path based on environment."""
-        if self.is_production:
-            return self.default_prod_db_path
-        return self.default_dev_db_path
+        return self._default_db_path
+
+    @cached_property
+    def frontend_origins_list(self) -> tuple[str, ...]:
+        """Parsed frontend origins, computed once per Settings instance."""
+        return tuple(
+            origin
+            for origin in (part.strip() for part in (self.frontend_origins or "").split(","))
+            if origin
+        )
 
     def get_frontend_origins_list(self) -> list[str]:
         """Parse and return the frontend origins as a list."""
-        if not self.frontend_origins:
-            return []
-        return [
-            origin.strip()
-            for origin in self.frontend_origins.split(",")
-            if origin.strip()
-        ]
+        return list(self.frontend_origins_list)
 
     def get_effective_database_url(self) -> str:
         """
@@ -217,8 +349,8 @@ class Settings(BaseSettings):
         If DATABASE_URL is not explicitly set, returns a SQLite URL using
         the appropriate default path for the current environment.
         """
-        # Check if DATABASE_URL was explicitly set in environment
-        if "DATABASE_URL" in os.environ:
+        # Check if DATABASE_URL was explicitly set in environment (captured at construction)
+        if self._database_url_from_env:
             return self.database_url
 
         # Otherwise, use the environment-appropriate default
@@ -229,8 +361,25 @@ class Settings(BaseSettings):
 # Global Settings Instance
 # ========================================================================
 
-# Create a singleton instance that can be imported throughout the application
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the cached application settings.
+
+    The .env file is parsed and validated only once per process. Use this as a
+    FastAPI dependency (``Depends(get_settings)``) and call
+    ``get_settings.cache_clear()`` in tests that change the environment.
+    """
+    return Settings()
+
+
+def get_unvalidated_settings(**overrides) -> Settings:
+    """
+    Return the cached settings with ``overrides`` applied, skipping validators.
+
+    Built via ``Settings.fast_load``, so it follows ``get_settings.cache_clear()``.
+    """
+    return Settings.fast_load(**overrides)
 
 
 # ========================================================================
@@ -244,6 +393,20 @@ DEV_DEMO_SEED_ENV = "MANITY_ENABLE_DEMO_SEED"
 FRONTEND_ORIGINS_ENV = "FRONTEND_ORIGINS"
 FRONTEND_ORIGIN_REGEX_ENV = "FRONTEND_ORIGIN_REGEX"
 PROTECTED_ENVIRONMENTS = {"prod", "production", "test", "testing"}
-DEFAULT_DEV_DB_PATH = settings.default_dev_db_path
-DEFAULT_PROD_DB_PATH = settings.default_prod_db_path
-DEFAULT_DB_PATH = settings.default_db_path
+
+# Settings-derived names are resolved on first access (PEP 562) so that
+# importing this module does not read .env or run any validators.
+_LAZY_SETTINGS_ATTRIBUTES = {
+    "DEFAULT_DEV_DB_PATH": "default_dev_db_path",
+    "DEFAULT_PROD_DB_PATH": "default_prod_db_path",
+    "DEFAULT_DB_PATH": "default_db_path",
+}
+
+
+def __getattr__(name: str):
+    # `settings` is the singleton instance that can be imported throughout the application
+    if name == "settings":
+        return get_settings()
+    if name in _LAZY_SETTINGS_ATTRIBUTES:
+        return getattr(get_settings(), _LAZY_SETTINGS_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
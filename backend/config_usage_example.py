@@ -45,7 +45,8 @@ print(f"Default DB path: {DEFAULT_DB_PATH}")
 
 from config import Settings
 
-# This is useful in tests where you want to override settings
+# This is useful in tests where you want to override settings.
+# Note: explicit Settings(...) calls re-read .env; prefer get_settings() elsewhere.
 test_settings = Settings(
     database_url="sqlite:///:memory:",
     manity_env="testing",
@@ -54,6 +55,13 @@ test_settings = Settings(
 
 print(f"Test database: {test_settings.database_url}")
 
+# When constructing many instances (e.g. per-test), skip validation entirely.
+# Overrides are not normalized, so pass lowercase/slash-free values.
+fast_test_settings = Settings.fast_load(
+    database_url="sqlite:///:memory:",
+    manity_env="testing",
+)
+
 
 # ============================================================================
 # Example: Using settings in FastAPI dependency
@@ -62,13 +70,18 @@ print(f"Test database: {test_settings.database_url}")
 from fastapi import Depends, HTTPException, Header
 from typing import Optional
 
-def verify_admin_token(authorization: Optional[str] = Header(None)):
+from config import get_settings
+
+def verify_admin_token(
+    authorization: Optional[str] = Header(None),
+    app_settings: Settings = Depends(get_settings),
+):
     """FastAPI dependency to verify admin token."""
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
     
     token = authorization.replace("Bearer ", "")
-    if token != settings.manity_admin_token:
+    if token != app_settings.manity_admin_token:
         raise HTTPException(status_code=403, detail="Invalid admin token")
     
     return token
@@ -1,10 +1,9 @@
 """Project, Task, and Subtask models for the Manity application."""
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from pydantic import BaseModel
-from sqlalchemy import Column, ForeignKey, String
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import Column, ForeignKey, String, literal_column
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -49,6 +48,7 @@ class Subtask(SubtaskBase, table=True):
     """Subtask entity representing a sub-item of a task."""
     id: Optional[str] = Field(default=None, primary_key=True)
     task_id: Optional[str] = Field(default=None, foreign_key="task.id")
+    position: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     assignee_id: Optional[str] = Field(default=None, foreign_key="person.id")
     task: "Task" = Relationship(back_populates="subtasks")
     assignee: Optional["Person"] = Relationship(sa_relationship_kwargs={"lazy": "joined"})
@@ -72,12 +72,16 @@ class Task(TaskBase, table=True):
     """Task entity representing a work item in a project plan."""
     id: Optional[str] = Field(default=None, primary_key=True)
     project_id: Optional[str] = Field(default=None, foreign_key="project.id")
+    position: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     assignee_id: Optional[str] = Field(default=None, foreign_key="person.id")
     project: "Project" = Relationship(back_populates="plan")
     assignee: Optional["Person"] = Relationship(sa_relationship_kwargs={"lazy": "joined"})
     subtasks: list[Subtask] = Relationship(
         back_populates="task",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "order_by": [Subtask.position, literal_column("subtask.rowid")],
+        },
     )
 
 
@@ -92,10 +96,6 @@ class ProjectBase(SQLModel):
     executiveUpdate: Optional[str] = None
     startDate: Optional[str] = None
     targetDate: Optional[str] = None
-    stakeholders_legacy: List[Stakeholder] = Field(
-        default_factory=list,
-        sa_column=Column("stakeholders", JSON, nullable=True),
-    )
 
 
 class Project(ProjectBase, table=True):
@@ -107,14 +107,18 @@ class Project(ProjectBase, table=True):
     )
     plan: list[Task] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "order_by": [Task.position, literal_column("task.rowid")],
+        },
     )
     recentActivity: list["Activity"] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "order_by": "[Activity.date.desc(), literal_column('activity.rowid')]"},
     )
     stakeholders: list["Person"] = Relationship(
         back_populates="projects",
         link_model=ProjectPersonLink,
+        sa_relationship_kwargs={"order_by": literal_column("projectpersonlink.rowid")},
     )
     initiative: Optional["Initiative"] = Relationship(back_populates="projects")
@@ -33,9 +33,9 @@ def update_email_settings(payload: EmailSettingsPayload, session: Session = Depe
     settings.use_tls = payload.useTLS
 
     session.add(settings)
+    response = serialize_email_settings(settings)
     session.commit()
-    session.refresh(settings)
-    return serialize_email_settings(settings)
+    return response
 
 
 @router.post("/actions/email", status_code=status.HTTP_202_ACCEPTED)
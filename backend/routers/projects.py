@@ -1,18 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlmodel import Session, select
 
 from backend.main import (
-    Activity,
+    PersonIndex,
     Project,
+    PROJECTS_CACHE_CONTROL,
     ProjectPayload,
-    Task,
-    Subtask,
     add_data_change_activity,
-    build_person_index,
+    etag_matches,
+    get_person_index,
+    get_read_session,
     get_session,
     load_project,
     log_action,
+    portfolio_etag,
+    serialize_all_projects_cached,
     serialize_project,
     serialize_project_with_people,
     upsert_project,
@@ -22,18 +24,12 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @router.get("")
-def list_projects(session: Session = Depends(get_session)):
-    person_index = build_person_index(session)
-    statement = select(Project).options(
-        selectinload(Project.plan).selectinload(Task.subtasks),
-        selectinload(Project.plan).selectinload(Task.assignee),
-        selectinload(Project.plan).selectinload(Task.subtasks).selectinload(Subtask.assignee),
-        selectinload(Project.recentActivity),
-        selectinload(Project.recentActivity).selectinload(Activity.author_person),
-        selectinload(Project.stakeholders),
-    )
-    projects = session.exec(statement).all()
-    return [serialize_project(project, person_index) for project in projects]
+def list_projects(request: Request, session: Session = Depends(get_read_session)):
+    etag = portfolio_etag(session)
+    headers = {"ETag": etag, "Cache-Control": PROJECTS_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=serialize_all_projects_cached(session, etag), media_type="application/json", headers=headers)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -44,9 +40,9 @@ def create_project(payload: ProjectPayload, request: Request, session: Session =
 
 
 @router.get("/{project_id}")
-def get_project(project_id: str, session: Session = Depends(get_session)):
+def get_project(project_id: str, session: Session = Depends(get_read_session), person_index: PersonIndex = Depends(get_person_index)):
     project = load_project(session, project_id)
-    return serialize_project_with_people(session, project)
+    return serialize_project(project, person_index)
 
 
 @router.put("/{project_id}")
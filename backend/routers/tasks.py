@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlmodel import Session, select
 
 from backend.main import (
+    NEXT_SUBTASK_POSITION_STATEMENT,
+    NEXT_TASK_POSITION_STATEMENT,
     Person,
     Subtask,
     SubtaskPayload,
@@ -13,29 +15,32 @@ from backend.main import (
     get_session,
     load_project,
     log_action,
+    project_exists,
     resolve_person_reference,
     serialize_project_with_people,
+    serialize_subtask,
+    serialize_task,
 )
 
 router = APIRouter(prefix="/projects", tags=["tasks"])
 
 
 @router.post("/{project_id}/tasks")
-def create_task(project_id: str, payload: TaskPayload, request: Request, session: Session = Depends(get_session)):
-    project = load_project(session, project_id)
+def create_task(project_id: str, payload: TaskPayload, request: Request, full: bool = False, session: Session = Depends(get_session)):
+    if not project_exists(session, project_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     task = Task(
         id=payload.id or generate_id("task"),
         title=payload.title,
         status=payload.status,
         dueDate=payload.dueDate,
         completedDate=payload.completedDate,
-        project_id=project.id,
+        project_id=project_id,
         assignee_id=payload.assignee_id,
+        position=session.exec(NEXT_TASK_POSITION_STATEMENT, params={"project_id": project_id}).one(),
     )
     apply_task_payload(task, payload, session)
     session.add(task)
-    session.commit()
-    session.refresh(task)
 
     # Add activity for task creation
     assignee_name = None
@@ -48,13 +53,16 @@ def create_task(project_id: str, payload: TaskPayload, request: Request, session
     )
 
     log_action(session, "create_task", "task", task.id, {"project_id": project_id, "title": task.title}, request)
-    return serialize_project_with_people(session, load_project(session, project_id))
+    if full:
+        return serialize_project_with_people(session, load_project(session, project_id))
+    return serialize_task(task)
 
 
 @router.put("/{project_id}/tasks/{task_id}")
-def update_task(project_id: str, task_id: str, payload: TaskPayload, request: Request, session: Session = Depends(get_session)):
-    project = load_project(session, project_id)
-    task = session.exec(select(Task).where(Task.id == task_id, Task.project_id == project.id)).first()
+def update_task(project_id: str, task_id: str, payload: TaskPayload, request: Request, full: bool = False, session: Session = Depends(get_session)):
+    if not project_exists(session, project_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    task = session.exec(select(Task).where(Task.id == task_id, Task.project_id == project_id)).first()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
@@ -66,7 +74,6 @@ def update_task(project_id: str, task_id: str, payload: TaskPayload, request: Re
     old_assignee_id = task.assignee_id
     apply_task_payload(task, payload, session)
     session.add(task)
-    session.commit()
 
     # Build activity description with specific changes
     if old_title != task.title:
@@ -89,19 +96,21 @@ def update_task(project_id: str, task_id: str, payload: TaskPayload, request: Re
         )
 
     log_action(session, "update_task", "task", task_id, {"project_id": project_id, "title": task.title, "old_status": old_status, "new_status": task.status}, request)
-    return serialize_project_with_people(session, load_project(session, project_id))
+    if full:
+        return serialize_project_with_people(session, load_project(session, project_id))
+    return serialize_task(task)
 
 
 @router.delete("/{project_id}/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 def remove_task(project_id: str, task_id: str, request: Request, session: Session = Depends(get_session)):
-    project = load_project(session, project_id)
-    task = session.exec(select(Task).where(Task.id == task_id, Task.project_id == project.id)).first()
+    if not project_exists(session, project_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    task = session.exec(select(Task).where(Task.id == task_id, Task.project_id == project_id)).first()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
     deleted_data = {"project_id": project_id, "title": task.title}
     task_title = task.title
     session.delete(task)
-    session.commit()
 
     # Add activity for task deletion
     add_data_change_activity(session, project_id, request, f"Deleted task: {task_title}")
@@ -111,8 +120,9 @@ def remove_task(project_id: str, task_id: str, request: Request, session: Sessio
 
 
 @router.post("/{project_id}/tasks/{task_id}/subtasks")
-def create_subtask(project_id: str, task_id: str, payload: SubtaskPayload, request: Request, session: Session = Depends(get_session)):
-    load_project(session, project_id)
+def create_subtask(project_id: str, task_id: str, payload: SubtaskPayload, request: Request, full: bool = False, session: Session = Depends(get_session)):
+    if not project_exists(session, project_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     task = session.exec(select(Task).where(Task.id == task_id, Task.project_id == project_id)).first()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
@@ -125,11 +135,11 @@ def create_subtask(project_id: str, task_id: str, payload: SubtaskPayload, reque
         completedDate=payload.completedDate,
         task_id=task.id,
         assignee_id=assignee.id if assignee else payload.assignee_id,
+        position=session.exec(NEXT_SUBTASK_POSITION_STATEMENT, params={"task_id": task.id}).one(),
     )
     if assignee:
         subtask.assignee = assignee
     session.add(subtask)
-    session.commit()
 
     # Add activity for subtask creation
     assignee_name = None
@@ -142,12 +152,15 @@ def create_subtask(project_id: str, task_id: str, payload: SubtaskPayload, reque
     )
 
     log_action(session, "create_subtask", "subtask", subtask.id, {"project_id": project_id, "task_id": task_id, "title": subtask.title}, request)
-    return serialize_project_with_people(session, load_project(session, project_id))
+    if full:
+        return serialize_project_with_people(session, load_project(session, project_id))
+    return serialize_subtask(subtask)
 
 
 @router.put("/{project_id}/tasks/{task_id}/subtasks/{subtask_id}")
-def update_subtask(project_id: str, task_id: str, subtask_id: str, payload: SubtaskPayload, request: Request, session: Session = Depends(get_session)):
-    load_project(session, project_id)
+def update_subtask(project_id: str, task_id: str, subtask_id: str, payload: SubtaskPayload, request: Request, full: bool = False, session: Session = Depends(get_session)):
+    if not project_exists(session, project_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     subtask = session.exec(select(Subtask).where(Subtask.id == subtask_id, Subtask.task_id == task_id)).first()
     if not subtask:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
@@ -168,7 +181,7 @@ def update_subtask(project_id: str, task_id: str, subtask_id: str, payload: Subt
     subtask.dueDate = payload.dueDate
     subtask.completedDate = payload.completedDate
     # If caller explicitly provides assignee=None, treat that as "clear", regardless of assignee_id.
-    fields_set = getattr(payload, "model_fields_set", getattr(payload, "__fields_set__", set()))
+    fields_set = payload.model_fields_set
     if "assignee" in fields_set and payload.assignee is None:
         subtask.assignee = None
         subtask.assignee_id = None
@@ -177,7 +190,6 @@ def update_subtask(project_id: str, task_id: str, subtask_id: str, payload: Subt
         subtask.assignee_id = assignee.id if assignee else payload.assignee_id
 
     session.add(subtask)
-    session.commit()
 
     # Build activity description with specific changes
     if old_title != subtask.title:
@@ -200,12 +212,15 @@ def update_subtask(project_id: str, task_id: str, subtask_id: str, payload: Subt
         )
 
     log_action(session, "update_subtask", "subtask", subtask_id, {"project_id": project_id, "task_id": task_id, "title": subtask.title, "old_status": old_status, "new_status": subtask.status}, request)
-    return serialize_project_with_people(session, load_project(session, project_id))
+    if full:
+        return serialize_project_with_people(session, load_project(session, project_id))
+    return serialize_subtask(subtask)
 
 
 @router.delete("/{project_id}/tasks/{task_id}/subtasks/{subtask_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_subtask(project_id: str, task_id: str, subtask_id: str, request: Request, session: Session = Depends(get_session)):
-    load_project(session, project_id)
+    if not project_exists(session, project_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     subtask = session.exec(select(Subtask).where(Subtask.id == subtask_id, Subtask.task_id == task_id)).first()
     if not subtask:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
@@ -217,7 +232,6 @@ def delete_subtask(project_id: str, task_id: str, subtask_id: str, request: Requ
     deleted_data = {"project_id": project_id, "task_id": task_id, "title": subtask.title}
     subtask_title = subtask.title
     session.delete(subtask)
-    session.commit()
 
     # Add activity for subtask deletion
     add_data_change_activity(session, project_id, request, f"Deleted subtask '{subtask_title}' from task '{task_title}'")
@@ -5,6 +5,7 @@ Consolidates all person resolution logic for the Manity backend.
 This is the single source of truth for person lookups, creation, and upserts.
 """
 
+import uuid
 from typing import Any, Optional, Union
 from sqlmodel import Session, select
 
@@ -116,8 +117,6 @@ class PersonService:
         email: Optional[str] = None,
     ) -> Person:
         """Create a new person."""
-        import uuid
-
         normalized_name, normalized_email = normalize_person_identity(name, email)
 
         if not normalized_name:
@@ -132,7 +131,6 @@ class PersonService:
 
         self.session.add(person)
         self.session.commit()
-        self.session.refresh(person)
 
         return person
 
@@ -143,8 +141,6 @@ class PersonService:
         If a person with the same name or email exists, update their info.
         Otherwise, create a new person.
         """
-        import uuid
-
         normalized_name, normalized_email = normalize_person_identity(
             payload.name, payload.email
         )
@@ -168,7 +164,6 @@ class PersonService:
 
             self.session.add(existing)
             self.session.commit()
-            self.session.refresh(existing)
             return existing
 
         # Create new person
@@ -262,7 +257,6 @@ class PersonService:
             if updated:
                 self.session.add(existing)
                 self.session.commit()
-                self.session.refresh(existing)
 
             return existing
 
@@ -74,18 +74,18 @@ def test_crud_and_persistence(tmp_path):
             "dueDate": "2025-12-01",
             "completedDate": None,
         }
-        project = client.post(f"/projects/{project_id}/tasks", json=task_payload).json()
+        project = client.post(f"/projects/{project_id}/tasks", json=task_payload, params={"full": 1}).json()
         task_id = project["plan"][0]["id"]
 
         updated_task = {**task_payload, "id": task_id, "status": "in-progress"}
         project = client.put(
-            f"/projects/{project_id}/tasks/{task_id}", json=updated_task
+            f"/projects/{project_id}/tasks/{task_id}", json=updated_task, params={"full": 1}
         ).json()
         assert project["plan"][0]["status"] == "in-progress"
 
         subtask_one = {"title": "Collect requirements", "status": "todo", "dueDate": None, "completedDate": None}
         project = client.post(
-            f"/projects/{project_id}/tasks/{task_id}/subtasks", json=subtask_one
+            f"/projects/{project_id}/tasks/{task_id}/subtasks", json=subtask_one, params={"full": 1}
         ).json()
         subtask_one_id = project["plan"][0]["subtasks"][0]["id"]
 
@@ -96,7 +96,7 @@ def test_crud_and_persistence(tmp_path):
             "completedDate": None,
         }
         project = client.post(
-            f"/projects/{project_id}/tasks/{task_id}/subtasks", json=subtask_two
+            f"/projects/{project_id}/tasks/{task_id}/subtasks", json=subtask_two, params={"full": 1}
         ).json()
         subtask_two_id = project["plan"][0]["subtasks"][1]["id"]
 
@@ -109,6 +109,7 @@ def test_crud_and_persistence(tmp_path):
         project = client.put(
             f"/projects/{project_id}/tasks/{task_id}/subtasks/{subtask_two_id}",
             json=updated_subtask_two,
+            params={"full": 1},
         ).json()
         assert project["plan"][0]["subtasks"][1]["status"] == "completed"
 
@@ -119,7 +120,7 @@ def test_crud_and_persistence(tmp_path):
 
         activity_one = {"date": "2025-12-01", "note": "Kickoff", "author": "Alex"}
         project = client.post(
-            f"/projects/{project_id}/activities", json=activity_one
+            f"/projects/{project_id}/activities", json=activity_one, params={"full": 1}
         ).json()
         activity_one_id = project["recentActivity"][0]["id"]
 
@@ -127,6 +128,7 @@ def test_crud_and_persistence(tmp_path):
         project = client.put(
             f"/projects/{project_id}/activities/{activity_one_id}",
             json=updated_activity,
+            params={"full": 1},
         ).json()
         assert any(
             activity.get("note") == "Kickoff complete" for activity in project.get("recentActivity", [])
@@ -134,7 +136,7 @@ def test_crud_and_persistence(tmp_path):
 
         activity_two = {"date": "2025-12-03", "note": "Draft shared", "author": "Jamie"}
         project = client.post(
-            f"/projects/{project_id}/activities", json=activity_two
+            f"/projects/{project_id}/activities", json=activity_two, params={"full": 1}
         ).json()
         activity_two_id = next(
             activity["id"] for activity in project["recentActivity"] if activity["note"] == activity_two["note"]
@@ -174,6 +176,428 @@ def test_crud_and_persistence(tmp_path):
         assert any(note == "Kickoff complete" for note in persisted_notes)
 
 
+def test_child_mutations_return_changed_entity(tmp_path):
+    with create_isolated_client(tmp_path / "entities.db") as client:
+        project = client.post(
+            "/projects",
+            json={"name": "Entity Project", "status": "active", "priority": "low", "progress": 0},
+        ).json()
+        project_id = project["id"]
+
+        task = client.post(
+            f"/projects/{project_id}/tasks", json={"title": "Plan", "status": "todo", "subtasks": []}
+        ).json()
+        assert task["title"] == "Plan"
+        assert task["subtasks"] == []
+        assert "plan" not in task
+
+        subtask = client.post(
+            f"/projects/{project_id}/tasks/{task['id']}/subtasks", json={"title": "Draft", "status": "todo"}
+        ).json()
+        assert subtask["title"] == "Draft"
+
+        subtask = client.put(
+            f"/projects/{project_id}/tasks/{task['id']}/subtasks/{subtask['id']}",
+            json={"title": "Draft", "status": "completed"},
+        ).json()
+        assert subtask["status"] == "completed"
+
+        task = client.put(
+            f"/projects/{project_id}/tasks/{task['id']}", json={"title": "Plan", "status": "in-progress"}
+        ).json()
+        assert task["status"] == "in-progress"
+        assert [item["id"] for item in task["subtasks"]] == [subtask["id"]]
+
+        activity = client.post(
+            f"/projects/{project_id}/activities", json={"date": "2025-12-01", "note": "Kickoff", "author": "Alex"}
+        ).json()
+        assert activity["note"] == "Kickoff"
+
+        activity = client.put(
+            f"/projects/{project_id}/activities/{activity['id']}",
+            json={"date": "2025-12-01", "note": "Kickoff done", "author": "Alex"},
+        ).json()
+        assert activity["note"] == "Kickoff done"
+
+        project = client.get(f"/projects/{project_id}").json()
+        assert project["plan"][0]["subtasks"][0]["status"] == "completed"
+        assert any(item["note"] == "Kickoff done" for item in project["recentActivity"])
+
+
+def test_task_update_diffs_subtasks_by_id(tmp_path):
+    from sqlalchemy import event
+
+    with create_isolated_client(tmp_path / "subtasks.db") as client:
+        project = client.post("/projects", json={"name": "Diffed"}).json()
+        task = client.post(
+            f"/projects/{project['id']}/tasks",
+            json={"title": "Plan", "subtasks": [{"title": f"Step {index}"} for index in range(4)]},
+        ).json()
+        kept, edited, untouched, dropped = task["subtasks"]
+
+        writes = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith(("INSERT INTO subtask", "UPDATE subtask", "DELETE FROM subtask")):
+                writes.append(statement.split()[0])
+
+        event.listen(main.engine, "before_cursor_execute", record)
+        try:
+            response = client.put(
+                f"/projects/{project['id']}/tasks/{task['id']}",
+                json={
+                    "title": "Plan",
+                    "subtasks": [
+                        {"id": kept["id"], "title": kept["title"]},
+                        {"id": edited["id"], "title": "Edited"},
+                        {"id": untouched["id"], "title": untouched["title"]},
+                        {"title": "Added"},
+                    ],
+                },
+            )
+        finally:
+            event.remove(main.engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert sorted(writes) == ["DELETE", "INSERT", "UPDATE"]
+        stored = client.get(f"/projects/{project['id']}").json()["plan"][0]["subtasks"]
+        assert [subtask["title"] for subtask in stored] == ["Step 0", "Edited", "Step 2", "Added"]
+        assert dropped["id"] not in {subtask["id"] for subtask in stored}
+
+
+def test_child_lookups_are_scoped_to_the_project(tmp_path):
+    with create_isolated_client(tmp_path / "scoped.db") as client:
+        project = client.post("/projects", json={"name": "Owner"}).json()
+        other = client.post("/projects", json={"name": "Other"}).json()
+        task = client.post(f"/projects/{project['id']}/tasks", json={"title": "Plan"}).json()
+        subtask = client.post(
+            f"/projects/{project['id']}/tasks/{task['id']}/subtasks", json={"title": "Draft"}
+        ).json()
+
+        assert client.post("/projects/missing/tasks", json={"title": "Plan"}).status_code == 404
+        assert client.put(
+            f"/projects/{other['id']}/tasks/{task['id']}", json={"title": "Moved"}
+        ).status_code == 404
+        assert client.put(
+            f"/projects/{other['id']}/tasks/{task['id']}/subtasks/{subtask['id']}", json={"title": "Moved"}
+        ).status_code == 404
+        assert client.delete(f"/projects/{other['id']}/tasks/{task['id']}/subtasks/{subtask['id']}").status_code == 404
+
+
+def test_activity_mutations_keep_last_update_in_sync(tmp_path):
+    with create_isolated_client(tmp_path / "last-update.db") as client:
+        project = client.post("/projects", json={"name": "Updates", "lastUpdate": "Imported"}).json()
+        base = f"/projects/{project['id']}/activities"
+
+        assert client.post("/projects/missing/activities", json={"date": "2025-01-01", "note": "x", "author": "A"}).status_code == 404
+
+        older = client.post(base, json={"date": "2025-01-01", "note": "Older", "author": "A"}).json()
+        newer = client.post(base, json={"date": "2025-02-01", "note": "Newer", "author": "A"}).json()
+        assert client.get(f"/projects/{project['id']}").json()["lastUpdate"] == "Newer"
+
+        client.put(f"{base}/{older['id']}", json={"date": "2025-03-01", "note": "Oldest edited", "author": "A"})
+        assert client.get(f"/projects/{project['id']}").json()["lastUpdate"] == "Oldest edited"
+
+        client.delete(f"{base}/{older['id']}")
+        assert client.get(f"/projects/{project['id']}").json()["lastUpdate"] == "Newer"
+
+        client.delete(f"{base}/{newer['id']}")
+        assert client.get(f"/projects/{project['id']}").json()["lastUpdate"] == "Newer"
+
+
+def test_list_projects_revalidates_with_etag(tmp_path):
+    with create_isolated_client(tmp_path / "etag.db") as client:
+        project = client.post("/projects", json={"name": "Cached"}).json()
+        first = client.get("/projects")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, max-age=0, must-revalidate"
+
+        cached = client.get("/projects", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert client.get("/projects", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+
+        task = client.post(f"/projects/{project['id']}/tasks", json={"title": "Plan"}).json()
+        changed = client.get("/projects", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()[0]["plan"][0]["title"] == "Plan"
+        assert changed.headers["etag"] != etag
+
+        etag = changed.headers["etag"]
+        client.delete(f"/projects/{project['id']}/tasks/{task['id']}")
+        assert client.get("/projects", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_projects_reuses_payload_until_the_portfolio_changes(tmp_path, monkeypatch):
+    with create_isolated_client(tmp_path / "payload.db") as client:
+        project = client.post("/projects", json={"name": "Cached"}).json()
+        calls = []
+        serialize = main.serialize_all_projects
+
+        def counting(session):
+            calls.append(session)
+            return serialize(session)
+
+        monkeypatch.setattr(main, "serialize_all_projects", counting)
+        first = client.get("/projects")
+        body = main._projects_payload_cache[2]
+        second = client.get("/projects")
+        # A hit serves the stored bytes as they are: nothing is re-validated or re-encoded
+        assert second.content == first.content == body
+        assert main._projects_payload_cache[2] is body
+        assert second.headers["content-type"] == "application/json"
+        assert len(calls) == 1
+
+        client.post(f"/projects/{project['id']}/tasks", json={"title": "Plan"})
+        assert client.get("/projects").json()[0]["plan"][0]["title"] == "Plan"
+        assert len(calls) == 2
+
+        # Core writes outside any ORM session invalidate the payload too
+        with main.engine.begin() as connection:
+            connection.exec_driver_sql("UPDATE task SET title = 'Replanned'")
+        assert client.get("/projects").json()[0]["plan"][0]["title"] == "Replanned"
+        assert len(calls) == 3
+
+
+def test_list_projects_sees_writes_made_by_other_workers(tmp_path):
+    db_path = tmp_path / "external.db"
+    with create_isolated_client(db_path) as client:
+        project = client.post("/projects", json={"name": "Cached"}).json()
+        first = client.get("/projects")
+        etag = first.headers["etag"]
+
+        # Another worker: its own engine and pool, no Python state shared with this one
+        other_worker = main.create_engine_from_env(f"sqlite:///{db_path}")
+        with other_worker.begin() as connection:
+            connection.exec_driver_sql("UPDATE project SET name = 'Renamed' WHERE id = ?", (project["id"],))
+        other_worker.dispose()
+
+        changed = client.get("/projects", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()[0]["name"] == "Renamed"
+        assert client.get("/projects", headers={"If-None-Match": changed.headers["etag"]}).status_code == 304
+
+
+def test_portfolio_version_moves_once_per_write_transaction(tmp_path):
+    with create_isolated_client(tmp_path / "version.db") as client:
+        def generation():
+            with main.engine.connect() as connection:
+                return connection.exec_driver_sql("SELECT generation FROM portfolio_version").scalar()
+
+        before = generation()
+        client.post(
+            "/projects",
+            json={"name": "Bulk", "plan": [{"title": f"Task {index}", "subtasks": [{"title": "Step"}] * 3} for index in range(20)]},
+        )
+        # 1 project, 20 tasks and 60 subtasks written in one transaction: one bump
+        assert generation() == before + 1
+
+        with main.engine.begin() as connection:
+            connection.exec_driver_sql("SELECT count(*) FROM project")
+        with main.engine.begin() as connection:
+            connection.exec_driver_sql("UPDATE project SET name = 'Rolled back'")
+            connection.rollback()
+        assert generation() == before + 1
+        with main.engine.connect() as connection:
+            triggers = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").all()
+        assert triggers == []
+
+
+def test_initiative_detail_loads_projects_in_constant_queries(tmp_path):
+    from sqlalchemy import event
+
+    def count_selects(client, initiative_id):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        engines = {main.engine, main.get_read_engine()}
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get(f"/initiatives/{initiative_id}")
+        finally:
+            for engine in engines:
+                event.remove(engine, "before_cursor_execute", record)
+        assert response.status_code == 200
+        person_scans = [statement for statement in statements if "FROM person" in statement and "WHERE" not in statement]
+        assert len(person_scans) == 1
+        return len(statements), response.json()
+
+    with create_isolated_client(tmp_path / "initiative.db") as client:
+        initiative = client.post("/initiatives", json={"name": "Growth"}).json()
+
+        def add_project(index):
+            project = client.post(
+                "/projects",
+                json={
+                    "name": f"Project {index}",
+                    "plan": [
+                        {"title": "Plan", "assignee": {"name": f"Owner {index}"}, "subtasks": [{"title": "Step"}]},
+                        {"title": "Ship", "subtasks": [{"title": "Release", "assignee": {"name": "Shared"}}]},
+                    ],
+                    "recentActivity": [{"date": "2025-01-01", "note": "Started", "author": f"Owner {index}"}],
+                },
+            ).json()
+            client.post(f"/initiatives/{initiative['id']}/projects/{project['id']}")
+
+        add_project(1)
+        with_one, _ = count_selects(client, initiative["id"])
+        for index in range(2, 5):
+            add_project(index)
+        with_four, detail = count_selects(client, initiative["id"])
+
+        assert with_four == with_one
+        assert len(detail["projects"]) == 4
+        assert all(project["plan"][1]["subtasks"][0]["assignee"]["name"] == "Shared" for project in detail["projects"])
+
+
+def test_adding_an_owner_serializes_stakeholders_in_constant_queries(tmp_path):
+    from sqlalchemy import event
+
+    def count_selects(client, initiative_id, person_id):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(main.engine, "before_cursor_execute", record)
+        try:
+            response = client.post(f"/initiatives/{initiative_id}/owners/{person_id}")
+        finally:
+            event.remove(main.engine, "before_cursor_execute", record)
+        assert response.status_code == 201
+        return len(statements), response.json()
+
+    with create_isolated_client(tmp_path / "owners.db") as client:
+        initiative = client.post("/initiatives", json={"name": "Growth"}).json()
+        owners = [client.post("/people", json={"name": f"Owner {index}", "team": "Ops"}).json() for index in range(2)]
+
+        def add_project(index):
+            project = client.post(
+                "/projects", json={"name": f"Project {index}", "stakeholders": [{"name": f"Stakeholder {index}"}]}
+            ).json()
+            client.post(f"/initiatives/{initiative['id']}/projects/{project['id']}")
+
+        add_project(1)
+        with_one, _ = count_selects(client, initiative["id"], owners[0]["id"])
+        for index in range(2, 5):
+            add_project(index)
+        with_four, serialized = count_selects(client, initiative["id"], owners[1]["id"])
+
+        assert with_four == with_one
+        assert {owner["id"] for owner in serialized["owners"]} == {owner["id"] for owner in owners}
+        assert len(serialized["stakeholders"]) == 4
+
+
+def test_plain_dict_routes_render_with_orjson(tmp_path, monkeypatch):
+    rendered = []
+    render = main.OrjsonResponse.render
+    monkeypatch.setattr(main.OrjsonResponse, "render", lambda self, content: rendered.append(content) or render(self, content))
+
+    with create_isolated_client(tmp_path / "orjson.db") as client:
+        initiative = client.post("/initiatives", json={"name": "Café"}).json()
+        assert initiative["name"] == "Café"
+        assert rendered and rendered[-1]["name"] == "Café"
+
+        # Project payloads are already plain dicts: no response_model pass, straight to orjson
+        rendered.clear()
+        project = client.post("/projects", json={"name": "Launch"}).json()
+        assert client.get(f"/projects/{project['id']}").json()["name"] == "Launch"
+        assert [content["name"] for content in rendered] == ["Launch", "Launch"]
+        route = next(route for route in main.app.routes if getattr(route, "path", None) == "/projects/{project_id}")
+        assert route.response_model is None
+        schema = client.get("/openapi.json").json()["paths"]["/projects/{project_id}"]["get"]["responses"]["200"]
+        assert schema["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/ProjectResponse"}
+
+        # response_model routes still serialize straight to bytes through pydantic-core
+        rendered.clear()
+        assert client.get("/settings/email").status_code == 200
+        assert rendered == []
+
+
+def test_project_response_model_matches_serializer(tmp_path):
+    with create_isolated_client(tmp_path / "response.db") as client:
+        client.post("/people", json={"name": "Alex", "team": "Eng", "email": "alex@example.com"})
+        project = client.post(
+            "/projects",
+            json={
+                "name": "Shape Project",
+                "stakeholders": [{"name": "Alex"}, {"name": "Jamie", "team": "Design"}],
+                "plan": [
+                    {"title": "Plan", "assignee": {"name": "Jamie"}, "subtasks": [{"title": "Draft"}, {"title": "Review"}]},
+                    {"title": "Ship", "subtasks": []},
+                ],
+                "recentActivity": [
+                    {
+                        "date": "2025-12-01",
+                        "note": "Kickoff",
+                        "author": "alex",
+                        "taskContext": {"taskId": "task-1", "taskTitle": "Plan"},
+                    },
+                    {"date": "2025-12-03", "note": "Follow-up", "author": "Someone Else"},
+                ],
+            },
+        ).json()
+        empty = client.post("/projects", json={"name": "Empty Project", "lastUpdate": "Nothing yet"}).json()
+        initiative = client.post("/initiatives", json={"name": "Initiative"}).json()
+        client.post(f"/initiatives/{initiative['id']}/projects/{project['id']}")
+
+        with Session(main.engine) as session:
+            person_index = main.build_person_index(session)
+            expected = [
+                main.serialize_project(main.load_project(session, project_id), person_index)
+                for project_id in (project["id"], empty["id"])
+            ]
+
+        assert client.get(f"/projects/{project['id']}").json() == expected[0]
+        assert client.get("/projects").json() == expected
+
+
+def test_serialize_all_projects_matches_serialize_project(tmp_path):
+    with create_isolated_client(tmp_path / "flat.db") as client:
+        # Link order deliberately differs from person id order
+        with Session(main.engine) as session:
+            session.add(main.Person(id="person-z", name="Zoe", team="Ops"))
+            session.add(main.Person(id="person-a", name="Ann", team="Eng", email="ann@example.com"))
+            session.commit()
+        client.post(
+            "/projects",
+            json={
+                "name": "Flat",
+                "stakeholders": [{"name": "Zoe"}, {"name": "Ann"}, {"name": "New Person"}],
+                "plan": [
+                    {"title": "First", "assignee": {"name": "Ann"}, "subtasks": [{"title": "A"}, {"title": "B"}]},
+                    {"title": "Second"},
+                ],
+                "recentActivity": [
+                    {"date": "2025-12-01", "note": "Older", "author": "zoe"},
+                    {"date": "2025-12-02", "note": "Same day", "author": "Ann"},
+                    {"date": "2025-12-02", "note": "Same day, later", "author": "Nobody"},
+                ],
+            },
+        )
+        client.post("/projects", json={"name": "Bare"})
+        initiative = client.post("/initiatives", json={"name": "Grouped"}).json()
+        client.post(f"/initiatives/{initiative['id']}/projects/{client.get('/projects').json()[1]['id']}")
+
+        with Session(main.engine) as session:
+            flat = main.serialize_all_projects(session)
+            person_index = main.build_person_index(session)
+            loaded = [main.serialize_project(main.load_project(session, item["id"]), person_index) for item in flat]
+
+        assert [item["name"] for item in flat] == ["Flat", "Bare"]
+        assert [person["id"] for person in flat[0]["stakeholders"]][:2] == ["person-z", "person-a"]
+        for flat_project, loaded_project in zip(flat, loaded):
+            assert list(flat_project) == list(loaded_project)
+            for field, value in loaded_project.items():
+                assert flat_project[field] == value, field
+
+
 def test_people_normalized_from_projects(tmp_path):
     db_path = tmp_path / "people.db"
 
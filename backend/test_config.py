@@ -0,0 +1,152 @@
+import pytest
+from pydantic import ValidationError
+
+import backend.config as config
+
+
+def test_get_settings_is_cached(monkeypatch):
+    config.get_settings.cache_clear()
+    first = config.get_settings()
+    monkeypatch.setenv("MANITY_ENV", "production")
+    assert config.get_settings() is first
+
+    config.get_settings.cache_clear()
+    refreshed = config.get_settings()
+    assert refreshed is not first
+    assert refreshed.is_production
+    config.get_settings.cache_clear()
+
+
+def test_fast_load_applies_overrides_without_validation():
+    config.get_settings.cache_clear()
+    fast = config.Settings.fast_load(manity_env="testing", openai_api_key="test-key")
+    assert fast.is_testing
+    assert fast.openai_api_key == "test-key"
+    assert fast.llm_model == config.get_settings().llm_model
+    assert config.get_unvalidated_settings().manity_env == config.get_settings().manity_env
+    assert config.get_unvalidated_settings(manity_env="testing").is_testing
+    assert config.get_settings.cache_info().currsize == 1
+    config.get_settings.cache_clear()
+
+
+def test_module_settings_are_resolved_lazily():
+    config.get_settings.cache_clear()
+    assert "settings" not in vars(config)
+    assert config.settings is config.get_settings()
+    assert config.DEFAULT_DB_PATH == config.get_settings().default_db_path
+    config.get_settings.cache_clear()
+
+
+def test_parse_boolean_accepts_common_spellings():
+    assert config.Settings.parse_boolean(" Yes ") is True
+    assert config.Settings.parse_boolean("OFF") is False
+    assert config.Settings.parse_boolean("") is False
+    assert config.Settings.parse_boolean(True) is True
+
+
+def test_frontend_origins_are_parsed_once():
+    app_settings = config.Settings.fast_load(frontend_origins=" http://a.test, ,http://b.test ")
+    assert app_settings.frontend_origins_list == ("http://a.test", "http://b.test")
+    assert app_settings.frontend_origins_list is app_settings.frontend_origins_list
+    assert app_settings.get_frontend_origins_list() == ["http://a.test", "http://b.test"]
+    config.get_settings.cache_clear()
+
+
+def test_env_aliases_follow_environment_changes_after_cache_clear(monkeypatch):
+    for name in ("MANITY_ADMIN_TOKEN", "ADMIN_KEY", "MANITY_ENV", "ENVIRONMENT"):
+        monkeypatch.delenv(name, raising=False)
+    config.get_settings.cache_clear()
+    assert config.get_settings().manity_admin_token is None
+
+    monkeypatch.setenv("ADMIN_KEY", "secret")
+    monkeypatch.setenv("ENVIRONMENT", "Production")
+    config.get_settings.cache_clear()
+    assert config.get_settings().manity_admin_token == "secret"
+    assert config.get_settings().is_production
+
+    monkeypatch.setenv("MANITY_ADMIN_TOKEN", "preferred")
+    monkeypatch.setenv("MANITY_ENV", "test")
+    config.get_settings.cache_clear()
+    assert config.get_settings().manity_admin_token == "preferred"
+    assert config.get_settings().is_testing
+    config.get_settings.cache_clear()
+
+
+def test_env_file_is_parsed_once(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("LLM_MODEL=cached-model\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LLM_MODEL", raising=False)
+
+    first = config.Settings()
+    assert first.llm_model == "cached-model"
+    assert env_file.resolve() in config._DOTENV_CACHE
+
+    monkeypatch.setattr(
+        config.DotEnvSettingsSource,
+        "_read_env_file",
+        lambda self, path: pytest.fail("env file should not be re-parsed"),
+    )
+    assert config.Settings().llm_model == "cached-model"
+
+
+def test_explicit_env_file_overrides_the_default(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("LLM_MODEL=dotenv-model\n")
+    (tmp_path / "other.env").write_text("LLM_MODEL=other-model\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LLM_MODEL", raising=False)
+
+    assert config.Settings().llm_model == "dotenv-model"
+    assert config.Settings(_env_file="other.env").llm_model == "other-model"
+    assert config.Settings(_env_file=None).llm_model == config.Settings.model_fields["llm_model"].default
+
+
+@pytest.mark.parametrize(
+    ("environment", "production", "development", "testing", "protected"),
+    [
+        ("production", True, False, False, True),
+        ("dev", False, True, False, False),
+        ("testing", False, False, True, True),
+        ("staging", False, False, False, False),
+    ],
+)
+def test_environment_flags(environment, production, development, testing, protected):
+    app_settings = config.Settings.fast_load(manity_env=environment)
+    assert app_settings.is_production is production
+    assert app_settings.is_development is development
+    assert app_settings.is_testing is testing
+    assert app_settings.is_protected_environment is protected
+    config.get_settings.cache_clear()
+
+
+def test_strip_trailing_slash():
+    assert config.Settings.strip_trailing_slash("https://api.example.com/v1//") == "https://api.example.com/v1"
+    url = "https://api.example.com/v1"
+    assert config.Settings.strip_trailing_slash(url) is url
+    assert config.Settings.strip_trailing_slash(None) is None
+
+
+def test_settings_are_frozen():
+    config.get_settings.cache_clear()
+    app_settings = config.get_settings()
+    with pytest.raises(ValidationError):
+        app_settings.manity_env = "production"
+    assert app_settings.get_frontend_origins_list() == list(app_settings.frontend_origins_list)
+    config.get_settings.cache_clear()
+
+
+def test_effective_database_url_uses_environment_captured_at_construction(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite:////tmp/explicit.db")
+    explicit = config.Settings.fast_load(database_url="sqlite:////tmp/explicit.db")
+    monkeypatch.delenv("DATABASE_URL")
+    assert explicit.get_effective_database_url() == "sqlite:////tmp/explicit.db"
+
+    fallback = config.Settings.fast_load(manity_env="production")
+    assert fallback.get_effective_database_url() == f"sqlite:///{fallback.default_prod_db_path}"
+    config.get_settings.cache_clear()
+
+
+def test_default_db_path_follows_environment():
+    assert config.Settings.fast_load(manity_env="prod").default_db_path.endswith("manity-data/portfolio.db")
+    assert config.Settings.fast_load(manity_env="dev").default_db_path.endswith("manity-dev-data/portfolio.db")
+    config.get_settings.cache_clear()
@@ -1,6 +1,9 @@
 import json
+import logging
 import os
+import sys
 import tempfile
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -129,7 +132,6 @@ def test_backfill_populates_missing_people(tmp_path):
         project = main.Project(
             id="legacy-project",
             name="Legacy",
-            stakeholders_legacy=[{"name": "Legacy Owner", "team": "Ops"}],
             recentActivity=[main.Activity(id="activity-1", date="2025-01-01", note="note", author="Legacy Owner")],
         )
         session.add(project)
@@ -137,11 +139,85 @@ def test_backfill_populates_missing_people(tmp_path):
 
         main.run_people_backfill(session)
 
-        refreshed_project = session.get(main.Project, "legacy-project")
         people = session.exec(select(main.Person)).all()
 
-        assert len(people) == 1
-        assert refreshed_project.stakeholders[0].id == people[0].id
+        assert [person.name for person in people] == ["Legacy Owner"]
+
+
+def test_migrate_people_links_resolves_people_without_per_row_queries(tmp_path):
+    from sqlalchemy import event
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'links.db'}")
+    main.create_db_and_tables()
+
+    # Legacy rows may point at people that no longer exist
+    with main.engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA foreign_keys = OFF")
+        connection.commit()
+        connection.exec_driver_sql("INSERT INTO person (id, name, team) VALUES ('person-1', 'Legacy Owner', '')")
+        for index in range(5):
+            connection.exec_driver_sql(
+                "INSERT INTO project (id, name, status, priority, progress, description) VALUES (?, ?, 'active', 'high', 0, '')",
+                (f"project-{index}", f"Project {index}"),
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO activity (id, date, note, author, project_id) VALUES (?, '2025-01-01', 'note', ' legacy owner ', ?)",
+                (f"activity-{index}", f"project-{index}"),
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO task (id, title, status, project_id, assignee_id) VALUES (?, 'Task', 'todo', ?, 'gone')",
+                (f"task-{index}", f"project-{index}"),
+            )
+        connection.commit()
+        connection.exec_driver_sql("PRAGMA foreign_keys = ON")
+
+    statements = []
+    record = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(main.engine, "before_cursor_execute", record)
+    with Session(main.engine) as session:
+        main.migrate_people_links(session)
+    event.remove(main.engine, "before_cursor_execute", record)
+
+    with main.engine.connect() as connection:
+        assert set(connection.exec_driver_sql("SELECT author_id, author FROM activity").all()) == {("person-1", "Legacy Owner")}
+        assert set(connection.exec_driver_sql("SELECT assignee_id FROM task").scalars()) == {None}
+    assert len([statement for statement in statements if statement.lstrip().startswith("SELECT")]) <= 6
+
+
+@pytest.mark.parametrize("drop_column_supported", [True, False])
+def test_legacy_stakeholder_json_is_moved_to_link_table(tmp_path, monkeypatch, drop_column_supported):
+    monkeypatch.setattr(main, "SQLITE_SUPPORTS_DROP_COLUMN", drop_column_supported)
+    db_path = tmp_path / "stakeholders.db"
+    main.engine = main.create_engine_from_env(f"sqlite:///{db_path}")
+    main.create_db_and_tables()
+
+    with main.engine.begin() as connection:
+        connection.exec_driver_sql("ALTER TABLE project ADD COLUMN stakeholders JSON")
+        connection.exec_driver_sql(
+            "INSERT INTO project (id, name, status, priority, progress, description, stakeholders) "
+            "VALUES ('legacy-project', 'Legacy', 'active', 'high', 0, '', ?)",
+            (json.dumps([{"name": "Legacy Owner", "team": "Ops"}, {"name": "legacy owner"}, {"name": " "}]),),
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO project (id, name, status, priority, progress, description, stakeholders) "
+            "VALUES ('empty-project', 'Empty', 'active', 'high', 0, '', '[]')"
+        )
+    main.forget_table_columns("project")
+
+    with Session(main.engine) as session:
+        main.migrate_project_stakeholders_to_links(session)
+
+        people = session.exec(select(main.Person)).all()
+        assert [(person.name, person.team) for person in people] == [("Legacy Owner", "Ops")]
+        assert [person.id for person in session.get(main.Project, "legacy-project").stakeholders] == [people[0].id]
+        assert session.get(main.Project, "empty-project").stakeholders == []
+        assert session.get(main.MigrationState, "project-stakeholder-links-v1") is not None
+
+        # Projects still insert whether or not the unmapped column survived
+        session.add(main.Project(id="new-project", name="New"))
+        session.commit()
+
+    assert main.table_has_column("project", "stakeholders") is not drop_column_supported
 
 
 def test_upsert_project_loads_relationships(tmp_path):
@@ -214,6 +290,149 @@ def test_upsert_project_loads_relationships(tmp_path):
         assert len(serialized["recentActivity"]) == 2
 
 
+def test_loaded_project_serializes_without_lazy_loads(tmp_path):
+    from sqlalchemy import event
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'full-project.db'}")
+    main.create_db_and_tables()
+
+    payload = main.ProjectPayload(
+        id="project-1",
+        name="Launch",
+        stakeholders=[{"name": "Riley"}],
+        plan=[{"title": "Plan", "assignee": {"name": "Sam"}, "subtasks": [{"title": "Draft", "assignee": {"name": "Riley"}}]}],
+        recentActivity=[{"date": "2025-01-01", "note": "Kickoff", "author": "Riley"}],
+    )
+    with Session(main.engine) as session:
+        main.upsert_project(session, payload, reload=False)
+        session.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(main.engine) as session:
+        project = main.load_project(session, "project-1")
+        event.listen(main.engine, "before_cursor_execute", record)
+        try:
+            serialized = main.serialize_project(project)
+        finally:
+            event.remove(main.engine, "before_cursor_execute", record)
+
+    assert statements == []
+    assert serialized["plan"][0]["assignee"]["name"] == "Sam"
+    assert serialized["plan"][0]["subtasks"][0]["assignee"]["name"] == "Riley"
+    assert [person["name"] for person in serialized["stakeholders"]] == ["Riley"]
+
+
+def test_apply_task_payload_replaces_subtasks(tmp_path):
+    db_path = tmp_path / "test.db"
+    main.engine = main.create_engine_from_env(f"sqlite:///{db_path}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        project = main.Project(id="project-1", name="Test Project")
+        task = main.Task(id="task-1", title="Old", project=project)
+        task.subtasks.append(main.Subtask(id="stale", title="Stale"))
+        session.add(project)
+        session.commit()
+
+        payload = main.TaskPayload(
+            title="New",
+            subtasks=[
+                main.SubtaskPayload(id="sub-1", title="First", status="completed", completedDate="2025-01-02"),
+                main.SubtaskPayload(title="Second"),
+            ],
+        )
+        main.apply_task_payload(task, payload, session)
+        session.commit()
+
+    with Session(main.engine) as session:
+        subtasks = session.exec(select(main.Subtask).order_by(main.Subtask.title)).all()
+        assert [(subtask.title, subtask.task_id) for subtask in subtasks] == [("First", "task-1"), ("Second", "task-1")]
+        assert subtasks[0].id == "sub-1"
+        assert subtasks[0].completedDate == "2025-01-02"
+        assert subtasks[1].id.startswith("subtask-")
+        assert subtasks[1].status == "todo"
+
+
+def test_apply_task_payload_updates_existing_subtasks(tmp_path):
+    db_path = tmp_path / "test.db"
+    main.engine = main.create_engine_from_env(f"sqlite:///{db_path}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        project = main.Project(id="project-1", name="Test Project")
+        task = main.Task(id="task-1", title="Plan", project=project)
+        task.subtasks.append(main.Subtask(id="sub-1", title="Draft"))
+        session.add(project)
+        session.commit()
+
+        payload = main.TaskPayload(
+            title="Plan",
+            subtasks=[main.SubtaskPayload(id="sub-1", title="Edited", status="completed", completedDate="2025-01-02")],
+        )
+        main.apply_task_payload(task, payload, session)
+        session.commit()
+
+    with Session(main.engine) as session:
+        subtask = session.get(main.Subtask, "sub-1")
+        assert (subtask.title, subtask.status, subtask.completedDate) == ("Edited", "completed", "2025-01-02")
+        assert subtask.task_id == "task-1"
+
+
+def test_read_session_is_query_only_and_sees_committed_writes(tmp_path):
+    client = _create_test_client(tmp_path)
+    project = client.post("/projects", json={"name": "Visible"}).json()
+
+    read_engine = main.get_read_engine()
+    assert read_engine is not main.engine
+    assert main.get_read_engine() is read_engine
+    assert client.get(f"/projects/{project['id']}").json()["name"] == "Visible"
+
+    with Session(read_engine) as session:
+        session.add(main.Project(id="blocked", name="Blocked"))
+        with pytest.raises(Exception, match="readonly"):
+            session.commit()
+
+
+def test_only_the_read_pool_gets_a_larger_page_cache(tmp_path):
+    _create_test_client(tmp_path)
+
+    with main.get_read_engine().connect() as connection:
+        read_cache_kib = -connection.exec_driver_sql("PRAGMA cache_size").scalar()
+    with main.engine.connect() as connection:
+        write_cache_kib = -connection.exec_driver_sql("PRAGMA cache_size").scalar()
+
+    assert read_cache_kib * main.SQLITE_POOL_OPTIONS["pool_size"] <= main.SQLITE_READ_CACHE_BUDGET_KIB
+    assert read_cache_kib > write_cache_kib
+
+
+def test_task_change_and_its_activity_commit_together(tmp_path, monkeypatch):
+    client = _create_test_client(tmp_path)
+    project = client.post("/projects", json={"name": "Launch", "plan": [{"id": "task-1", "title": "Plan"}]}).json()
+
+    commits = []
+    original_commit = Session.commit
+    monkeypatch.setattr(Session, "commit", lambda self: commits.append(1) or original_commit(self))
+
+    response = client.put(f"/projects/{project['id']}/tasks/task-1", json={"title": "Plan", "status": "completed"})
+    assert response.status_code == 200
+    assert len(commits) == 1
+
+    commits.clear()
+    assert client.delete(f"/projects/{project['id']}/tasks/task-1").status_code == 204
+    assert len(commits) == 1
+
+    with Session(main.engine) as session:
+        stored = main.load_project(session, project["id"])
+        notes = [activity.note for activity in stored.recentActivity]
+        assert notes == ["Deleted task: Plan", "Updated task 'Plan': status from todo to completed"]
+        assert stored.lastUpdate == "Deleted task: Plan"
+        assert stored.plan == []
+
+
 def test_import_portfolio_honors_query_mode_for_json_payload(tmp_path):
     client = _create_test_client(tmp_path)
 
@@ -231,6 +450,48 @@ def test_import_portfolio_honors_query_mode_for_json_payload(tmp_path):
         assert project_ids == {"existing", "new-project"}
 
 
+def test_merge_import_diffs_existing_projects_instead_of_recreating_them(tmp_path):
+    client = _create_test_client(tmp_path)
+    project = client.post(
+        "/projects",
+        json={
+            "name": "Existing",
+            "plan": [{"title": "Plan", "subtasks": [{"title": "Draft"}]}, {"title": "Ship"}],
+            "recentActivity": [{"date": "2025-01-01", "note": "Kickoff", "author": "Sam"}],
+        },
+    ).json()
+    # Later rows, so re-inserted children couldn't land back on their old rowids
+    client.post(
+        "/projects",
+        json={
+            "name": "Later",
+            "plan": [{"title": "Other", "subtasks": [{"title": "Other"}]}],
+            "recentActivity": [{"date": "2025-01-02", "note": "Other", "author": "Sam"}],
+        },
+    )
+
+    def stored_rows():
+        with main.engine.connect() as connection:
+            return {
+                table: connection.exec_driver_sql(f"SELECT rowid, id FROM {table} ORDER BY rowid").all()
+                for table in ("task", "subtask", "activity")
+            }
+
+    before = stored_rows()
+    exported = client.get(f"/projects/{project['id']}").json()
+    exported["plan"][1]["title"] = "Ship it"
+
+    response = client.post("/import?mode=merge", json={"projects": [exported]})
+
+    assert response.status_code == 200
+    # Deleting and re-inserting the project would hand every child a new rowid
+    assert stored_rows() == before
+    stored = client.get(f"/projects/{project['id']}").json()
+    assert [task["title"] for task in stored["plan"]] == ["Plan", "Ship it"]
+    assert stored["plan"][0]["subtasks"] == exported["plan"][0]["subtasks"]
+    assert stored["recentActivity"] == exported["recentActivity"]
+
+
 def test_import_portfolio_honors_query_mode_for_json_replace(tmp_path):
     client = _create_test_client(tmp_path)
 
@@ -288,6 +549,112 @@ def test_import_portfolio_honors_query_mode_for_file_replace(tmp_path):
         assert project_ids == {"replacement"}
 
 
+def test_import_portfolio_commits_once(tmp_path, monkeypatch):
+    client = _create_test_client(tmp_path)
+
+    with Session(main.engine) as session:
+        session.add(main.Project(id="existing", name="Existing Project"))
+        session.commit()
+
+    commits = []
+    original_commit = Session.commit
+    monkeypatch.setattr(Session, "commit", lambda self: commits.append(1) or original_commit(self))
+
+    payload = {
+        "projects": [
+            {"id": "existing", "name": "Reimported", "stakeholders": [{"name": "Robin Park", "team": "Ops"}]},
+            {"id": "second", "name": "Second", "plan": [{"title": "Task", "assignee": {"name": "Sam Lee"}}]},
+        ],
+        "people": [{"id": "person-1", "name": "Robin Park", "team": "Product"}],
+    }
+    response = client.post("/import?mode=merge", json=payload)
+
+    assert response.status_code == 200
+    # One commit for the import itself and one for the audit log; list_people only reads.
+    assert len(commits) == 2
+    names = {project["name"] for project in response.json()["projects"]}
+    assert names == {"Reimported", "Second"}
+    people = {person["name"]: person for person in response.json()["people"]}
+    assert set(people) == {"Robin Park", "Sam Lee"}
+    assert people["Robin Park"]["team"] == "Product"
+
+
+def test_writes_commit_with_their_audit_entry_without_refreshing(tmp_path, monkeypatch):
+    client = _create_test_client(tmp_path)
+    person = client.post("/people", json={"name": "Dana Cruz", "team": "Ops"}).json()
+    project = client.post("/projects", json={"name": "Audited"}).json()
+
+    commits = []
+    original_commit = Session.commit
+    monkeypatch.setattr(Session, "commit", lambda self: commits.append(1) or original_commit(self))
+    monkeypatch.setattr(Session, "refresh", lambda self, *args, **kwargs: pytest.fail("unexpected refresh"))
+
+    updated = client.put(f"/people/{person['id']}", json={"name": "Dana Cruz", "team": "Product"})
+    assert updated.json()["team"] == "Product"
+    initiative = client.post("/initiatives", json={"name": "Audited initiative", "owners": [{"name": "Dana Cruz"}]})
+    assert initiative.json()["owners"][0]["id"] == person["id"]
+    task = client.post(f"/projects/{project['id']}/tasks", json={"title": "Audited task"})
+    assert task.json()["title"] == "Audited task"
+
+    assert len(commits) == 3
+    with Session(main.engine) as session:
+        actions = session.exec(select(main.AuditLog.action)).all()
+    assert {"update_person", "create_initiative", "create_task"} <= set(actions)
+
+
+def test_audit_details_and_task_context_round_trip_as_json(tmp_path):
+    client = _create_test_client(tmp_path)
+    project = client.post("/projects", json={"name": "Café launch"}).json()
+    context = {"taskId": "t-1", "subtaskId": None, "taskTitle": "Crème brûlée", "subtaskTitle": None}
+
+    activity = client.post(
+        f"/projects/{project['id']}/activities",
+        json={"date": "2025-01-01", "note": "Started", "author": "Ana", "taskContext": context},
+    ).json()
+    assert activity["taskContext"] == context
+
+    with Session(main.engine) as session:
+        main.log_action(session, "custom", "project", project["id"], {"name": "Café", 1: "one"})
+        details = session.exec(select(main.AuditLog.details).where(main.AuditLog.action == "custom")).one()
+    assert json.loads(details) == {"name": "Café", "1": "one"}
+
+
+def test_person_helpers_leave_the_transaction_to_the_caller(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'people.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        created = main.resolve_person_reference(session, {"name": "Riley Fox", "team": "Ops"})
+        updated = main.upsert_person_from_details(session, name="riley fox", team="Design")
+        assert updated is created
+        assert session.get(main.Person, created.id).team == "Design"
+        session.rollback()
+
+    with Session(main.engine) as session:
+        assert session.exec(select(main.Person)).all() == []
+
+
+def test_import_portfolio_runs_database_work_off_the_event_loop(tmp_path, monkeypatch):
+    import asyncio
+
+    client = _create_test_client(tmp_path)
+    original_apply_import = main.apply_import
+    loops = []
+
+    def recording_apply_import(*args):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return original_apply_import(*args)
+
+    monkeypatch.setattr(main, "apply_import", recording_apply_import)
+    response = client.post("/import?mode=replace", json={"projects": [{"id": "p", "name": "Threaded"}]})
+
+    assert response.status_code == 200
+    assert loops == [None]
+
+
 def test_people_endpoint_is_idempotent_by_name(tmp_path):
     client = _create_test_client(tmp_path)
 
@@ -330,3 +697,820 @@ def test_import_people_collapses_duplicate_names(tmp_path):
     assert people[0]["name"] == "Jamie Li"
     assert people[0]["team"] == "Engineering"
     assert people[0]["email"] == "jamie@example.com"
+
+
+def test_create_db_and_tables_adds_missing_legacy_columns(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    main.engine = main.create_engine_from_env(f"sqlite:///{db_path}")
+    with main.engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE activity (id TEXT PRIMARY KEY, date TEXT, note TEXT, author TEXT)")
+
+    main.create_db_and_tables()
+
+    assert main.table_has_column("activity", "task_context")
+    assert main.table_has_column("activity", "author_id")
+    assert not main.table_has_column("activity", "missing_column")
+    with main.engine.connect() as connection:
+        columns = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(activity)")}
+    assert {"task_context", "author_id"} <= columns
+
+
+def test_table_rebuild_migrations_refresh_cached_columns(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'credentials.db'}")
+    with main.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE emailsettings (id INTEGER PRIMARY KEY, smtp_server VARCHAR NOT NULL DEFAULT '', "
+            "smtp_port INTEGER NOT NULL DEFAULT 587, use_tls BOOLEAN NOT NULL DEFAULT 1, "
+            "from_address VARCHAR, username VARCHAR, password VARCHAR)"
+        )
+    main.create_db_and_tables()
+    assert main.table_has_column("emailsettings", "password")
+
+    with Session(main.engine) as session:
+        main.migrate_remove_email_credentials(session)
+
+    assert not main.table_has_column("emailsettings", "username")
+    assert not main.table_has_column("emailsettings", "password")
+    assert main.table_has_column("emailsettings", "from_address")
+
+
+def test_table_columns_are_introspected_once_per_table(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'columns.db'}")
+    main.create_db_and_tables()
+    with main.engine.begin() as connection:
+        connection.exec_driver_sql('CREATE TABLE "odd table" ("odd column" TEXT)')
+    main.forget_table_columns("odd table", "missing")
+
+    assert main.table_has_column("odd table", "odd column")
+    assert not main.table_has_column("missing", "id")
+    assert main._PRAGMA_CACHE["missing"] == frozenset()
+
+    with main.engine.begin() as connection:
+        connection.exec_driver_sql('ALTER TABLE "odd table" ADD COLUMN late TEXT')
+    assert not main.table_has_column("odd table", "late")
+    main.forget_table_columns("odd table")
+    assert main.table_has_column("odd table", "late")
+
+
+def test_table_rebuild_keeps_referencing_rows_and_restores_foreign_keys(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'rebuild.db'}")
+    main.create_db_and_tables()
+    with Session(main.engine) as session:
+        session.add(main.Project(id="project-1", name="Rebuilt", stakeholders=[main.Person(id="person-1", name="Kept")]))
+        session.commit()
+
+    with main.table_rebuild_transaction() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE person_new (id TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE, team TEXT NOT NULL, email TEXT)"
+        )
+        connection.exec_driver_sql("INSERT INTO person_new SELECT id, name, team, email FROM person")
+        connection.exec_driver_sql("DROP TABLE person")
+        connection.exec_driver_sql("ALTER TABLE person_new RENAME TO person")
+
+    with pytest.raises(RuntimeError):
+        with main.table_rebuild_transaction():
+            raise RuntimeError("migration failed")
+
+    with pytest.raises(RuntimeError, match="foreign key violations"):
+        with main.table_rebuild_transaction() as connection:
+            connection.exec_driver_sql("DELETE FROM person")
+
+    with main.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert connection.exec_driver_sql("SELECT person_id FROM projectpersonlink").all() == [("person-1",)]
+        assert connection.exec_driver_sql("SELECT name FROM person").all() == [("Kept",)]
+
+
+def test_unique_constraint_migration_merges_duplicates(tmp_path, caplog):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'duplicates.db'}")
+    main.create_db_and_tables()
+    with main.engine.begin() as connection:
+        # Legacy databases had plain, non-unique name indexes
+        for table_name in ("project", "person"):
+            connection.exec_driver_sql(f"DROP INDEX ix_{table_name}_name")
+            connection.exec_driver_sql(f"CREATE INDEX ix_{table_name}_name ON {table_name} (name)")
+        connection.exec_driver_sql("INSERT INTO initiative (id, name, description, status, priority) VALUES ('init-1', 'Growth', '', 'active', 'high')")
+        for project_id, name in (("p1", "Launch"), ("p2", "launch"), ("p3", "LAUNCH"), ("p4", "Other")):
+            connection.exec_driver_sql(
+                "INSERT INTO project (id, name, status, priority, progress, description, initiative_id) "
+                "VALUES (?, ?, 'active', 'high', 0, '', 'init-1')",
+                (project_id, name),
+            )
+        for person_id, name in (("a", "Sam"), ("b", "sam"), ("c", "Kim")):
+            connection.exec_driver_sql("INSERT INTO person (id, name, team) VALUES (?, ?, '')", (person_id, name))
+        connection.exec_driver_sql("INSERT INTO task (id, title, status, project_id, assignee_id) VALUES ('t1', 'T', 'todo', 'p1', 'b')")
+        connection.exec_driver_sql("INSERT INTO activity (id, date, note, author, project_id, author_id) VALUES ('x1', '', '', 'sam', 'p1', 'b')")
+        connection.exec_driver_sql(
+            "INSERT INTO projectpersonlink (project_id, person_id) VALUES ('p1', 'a'), ('p1', 'b'), ('p2', 'b')"
+        )
+
+    assert not main.column_has_unique_constraint("project", "name")
+    with Session(main.engine) as session, caplog.at_level(logging.DEBUG, logger=main.logger.name):
+        main.migrate_add_unique_constraints(session)
+
+    assert main.column_has_unique_constraint("project", "name")
+    assert "Renamed 2 duplicate project names" in caplog.messages
+    assert "Merged 1 duplicate person entries across 1 name groups" in caplog.messages
+    assert "Renamed duplicate projects: ['launch (2)', 'LAUNCH (3)']" in caplog.messages
+    with main.engine.connect() as connection:
+        projects = dict(connection.exec_driver_sql("SELECT id, name FROM project").all())
+        assert projects == {"p1": "Launch", "p2": "launch (2)", "p3": "LAUNCH (3)", "p4": "Other"}
+        assert {row[0] for row in connection.exec_driver_sql("SELECT initiative_id FROM project")} == {"init-1"}
+        assert connection.exec_driver_sql("SELECT id FROM person ORDER BY id").scalars().all() == ["a", "c"]
+        assert connection.exec_driver_sql("SELECT assignee_id FROM task").scalar() == "a"
+        assert connection.exec_driver_sql("SELECT author_id FROM activity").scalar() == "a"
+        links = connection.exec_driver_sql("SELECT project_id, person_id FROM projectpersonlink ORDER BY project_id").all()
+        assert [tuple(link) for link in links] == [("p1", "a"), ("p2", "a")]
+        indexes = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'").scalars().all()
+        assert {"ix_person_name_lower", "ix_person_email_lower", "ix_project_name_lower"} <= set(indexes)
+
+
+def test_legacy_people_with_blank_names_are_merged_before_the_unique_rebuild(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'blank-names.db'}")
+    main.create_db_and_tables()
+    with main.engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_person_name")
+        connection.exec_driver_sql("CREATE INDEX ix_person_name ON person (name)")
+        for person_id, email in (("a", None), ("b", None), ("c", "c@example.com"), ("d", "")):
+            connection.exec_driver_sql("INSERT INTO person (id, name, team, email) VALUES (?, '', '', ?)", (person_id, email))
+        connection.exec_driver_sql("INSERT INTO person (id, name, team, email) VALUES ('e', 'Sam', '', '')")
+
+    with Session(main.engine) as session:
+        applied = main.load_applied_migrations(session)
+        main.migrate_add_unique_constraints(session, applied)
+        main.migrate_merge_duplicate_people(session, applied)
+
+    assert main.column_has_unique_constraint("person", "name")
+    with main.engine.connect() as connection:
+        people = connection.exec_driver_sql("SELECT id, name, email FROM person ORDER BY id").all()
+        # Blank names still collapse into one row; blank emails never group people and become NULL
+        assert [tuple(person) for person in people] == [("a", "", "c@example.com"), ("e", "Sam", None)]
+
+
+def test_person_references_respect_the_unique_name_and_email(tmp_path):
+    client = _create_test_client(tmp_path)
+    alice = client.post("/people", json={"name": "Alice", "team": "Eng", "email": "alice@example.com"}).json()
+    bob = client.post("/people", json={"name": "Bob", "team": "Ops"}).json()
+
+    # An unknown id with a taken name resolves to that person instead of failing the insert
+    project = client.post(
+        "/projects", json={"name": "Shared", "stakeholders": [{"id": "new-id", "name": "alice"}]}
+    )
+    assert project.status_code == 201
+    assert [person["id"] for person in project.json()["stakeholders"]] == [alice["id"]]
+
+    taken_name = client.post(
+        "/projects", json={"name": "Renamed", "stakeholders": [{"id": bob["id"], "name": "ALICE"}]}
+    )
+    assert taken_name.status_code == 400
+    assert client.put(
+        f"/people/{bob['id']}", json={"name": "Bob", "team": "Ops", "email": "Alice@example.com"}
+    ).status_code == 400
+    assert client.put(f"/people/{bob['id']}", json={"name": "Bob", "team": "Ops", "email": " "}).json()["email"] is None
+    assert [person["name"] for person in client.get("/people").json()] == ["Alice", "Bob"]
+
+
+def test_duplicate_people_are_merged_once_and_listing_only_reads(tmp_path):
+    from sqlalchemy.exc import IntegrityError
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'people-merge.db'}")
+    main.create_db_and_tables()
+    with main.engine.begin() as connection:
+        for person_id, name, team, email in (
+            ("a", "Sam", "", None),
+            ("b", "sam", "Ops", "sam@example.com"),
+            ("c", "Kim", "", "kim@example.com"),
+            ("d", "Kimberly", "Design", "KIM@example.com"),
+        ):
+            connection.exec_driver_sql("INSERT INTO person (id, name, team, email) VALUES (?, ?, ?, ?)", (person_id, name, team, email))
+        connection.exec_driver_sql("INSERT INTO project (id, name, status, priority, progress, description) VALUES ('p1', 'Launch', 'active', 'high', 0, '')")
+        connection.exec_driver_sql("INSERT INTO task (id, title, status, project_id, assignee_id) VALUES ('t1', 'T', 'todo', 'p1', 'd')")
+        connection.exec_driver_sql("INSERT INTO projectpersonlink (project_id, person_id) VALUES ('p1', 'a'), ('p1', 'b')")
+
+    with Session(main.engine) as session:
+        main.migrate_merge_duplicate_people(session)
+        main.migrate_merge_duplicate_people(session)
+
+    with main.engine.connect() as connection:
+        people = connection.exec_driver_sql("SELECT id, name, team, email FROM person ORDER BY id").all()
+        assert [tuple(person) for person in people] == [
+            ("a", "Sam", "Ops", "sam@example.com"),
+            ("c", "Kim", "Design", "kim@example.com"),
+        ]
+        assert connection.exec_driver_sql("SELECT assignee_id FROM task").scalar() == "c"
+        assert connection.exec_driver_sql("SELECT person_id FROM projectpersonlink").scalars().all() == ["a"]
+        with pytest.raises(IntegrityError):
+            connection.exec_driver_sql("INSERT INTO person (id, name, team) VALUES ('e', 'SAM', '')")
+        with pytest.raises(IntegrityError):
+            connection.exec_driver_sql("INSERT INTO person (id, name, team, email) VALUES ('e', 'Eve', '', 'Kim@Example.com')")
+
+    with Session(main.engine) as session:
+        connection = session.connection().connection.dbapi_connection
+        before = connection.total_changes
+        assert [person["name"] for person in main.list_people(session)] == ["Sam", "Kim"]
+        assert connection.total_changes == before
+        assert not session.dirty and not session.deleted
+
+
+def test_case_insensitive_lookups_use_expression_indexes(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'lookups.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        session.add(main.Person(id="person-1", name="Jordan Blake", email="Jordan@Example.com"))
+        session.commit()
+        assert main.get_person_by_name(session, " jordan blake ").id == "person-1"
+        assert main.get_person_by_email(session, "jordan@example.COM").id == "person-1"
+
+    with main.engine.connect() as connection:
+        for query, index_name in (
+            ("SELECT id FROM person WHERE lower(person.name) = ?", "ix_person_name_lower"),
+            ("SELECT id FROM person WHERE lower(person.email) = ?", "ix_person_email_lower"),
+            ("SELECT id FROM project WHERE lower(project.name) = lower(?)", "ix_project_name_lower"),
+        ):
+            plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}", ("x",)))
+            assert index_name in plan
+
+        name_check = str(main.PROJECT_NAME_TAKEN_STATEMENT.compile(main.engine))
+        plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {name_check}", ("x", "y", 1, 0)))
+        assert "ix_project_name_lower" in plan
+
+
+def test_recent_activity_is_loaded_newest_first_from_the_index(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'activity-order.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        project = main.Project(id="project-1", name="Ordered")
+        project.recentActivity = [
+            main.Activity(id=f"activity-{date}", date=date, note=f"Note {date}")
+            for date in ("2025-02-01", "2025-03-01", "2025-01-01")
+        ]
+        session.add(project)
+        session.commit()
+
+    with Session(main.engine) as session:
+        project = main.normalize_project_activity(session.get(main.Project, "project-1"))
+        assert [activity.date for activity in project.recentActivity] == ["2025-03-01", "2025-02-01", "2025-01-01"]
+        assert project.lastUpdate == "Note 2025-03-01"
+        assert main.serialize_all_projects(session)[0]["lastUpdate"] == "Note 2025-03-01"
+
+    with main.engine.connect() as connection:
+        query = "SELECT id FROM activity WHERE activity.project_id = ? ORDER BY activity.date DESC, activity.rowid"
+        plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}", ("x",)))
+        assert "ix_activity_project_recent" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_same_date_activities_keep_one_order_everywhere(tmp_path):
+    client = _create_test_client(tmp_path)
+    project = client.post(
+        "/projects",
+        json={
+            "name": "Same day",
+            "recentActivity": [{"date": "2025-01-01", "note": note} for note in ("first", "second", "third")],
+        },
+    ).json()
+
+    def feeds():
+        detail = client.get(f"/projects/{project['id']}").json()
+        listed = client.get("/projects").json()[0]
+        return detail, listed
+
+    for stored in feeds():
+        assert [activity["note"] for activity in stored["recentActivity"]] == ["first", "second", "third"]
+        assert stored["lastUpdate"] == "first"
+
+    client.post(f"/projects/{project['id']}/activities", json={"date": "2025-01-01", "note": "fourth"})
+    for stored in feeds():
+        assert [activity["note"] for activity in stored["recentActivity"]] == ["first", "second", "third", "fourth"]
+        assert stored["lastUpdate"] == "first"
+
+
+def test_resolve_person_reference_dispatches_on_reference_type(tmp_path):
+    from collections import OrderedDict
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'references.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        payload = main.resolve_person_reference(session, main.PersonPayload(name="Morgan", team="Ops", email="m@example.com"))
+        assert (payload.team, payload.email) == ("Ops", "m@example.com")
+
+        stakeholder = main.resolve_person_reference(session, main.Stakeholder(id=payload.id, name="Morgan", email="other@example.com"))
+        assert stakeholder is payload
+        assert stakeholder.email == "m@example.com"
+
+        ordered = main.resolve_person_reference(session, OrderedDict(name="Quinn", team="Design"))
+        assert ordered.team == "Design"
+        assert main._PERSON_REF_EXTRACTORS[OrderedDict] is main._PERSON_REF_EXTRACTORS[dict]
+        assert main.resolve_person_reference(session, 42) is None
+
+
+def test_person_index_interns_keys_and_resolves_email_before_name():
+    jordan = main.Person(id="person-1", name="Jordan Blake", email="Jordan@Example.com")
+    casey = main.Person(id="person-2", name="Casey")
+    index = main.PersonIndex([jordan, casey])
+
+    key = next(iter(index.by_email))
+    assert key is sys.intern("jordan@example.com")
+    assert index.resolve(email="JORDAN@example.com", name="Casey") is jordan
+    assert index.resolve(email="other@example.com", name="casey") is casey
+    assert index.resolve(person_id="missing", name="nobody") is None
+    assert main._normalize_person_identity(" Casey ", " Casey@Example.com ")[1] is sys.intern("casey@example.com")
+
+
+def test_resolve_existing_person_prefers_id_then_email_then_name(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'resolve.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        session.add(main.Person(id="by-id", name="Avery"))
+        session.add(main.Person(id="by-email", name="Blair", email="shared@example.com"))
+        session.add(main.Person(id="by-name", name="Casey"))
+        session.commit()
+
+        def resolve(**kwargs):
+            kwargs.setdefault("normalized_name", "casey")
+            person = main._resolve_existing_person(session, **kwargs)
+            return person.id if person else None
+
+        assert resolve(person_id="by-id", normalized_email="shared@example.com") == "by-id"
+        assert resolve(person_id="missing", normalized_email="shared@example.com") == "by-email"
+        assert resolve(normalized_email="nobody@example.com") == "by-name"
+        assert resolve(normalized_name="Nobody") is None
+        assert resolve(normalized_name="") is None
+
+    with main.engine.connect() as connection:
+        query = str(main.PERSON_MATCH_STATEMENT.compile(connection))
+        plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}", ("x",) * query.count("?")))
+        assert "ix_person_name_lower" in plan
+        assert "ix_person_email_lower" in plan
+
+
+def test_restart_checks_applied_migrations_in_one_query(tmp_path, monkeypatch):
+    from sqlalchemy import event
+
+    monkeypatch.setenv(main.DEV_DEMO_SEED_ENV, "0")
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'restart.db'}")
+    main.on_startup()
+
+    statements = []
+    event.listen(main.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    monkeypatch.setattr(main, "column_has_unique_constraint", lambda *args: pytest.fail("migration re-checked"))
+    main.on_startup()
+
+    assert len([statement for statement in statements if statement.startswith("SELECT") and "migrationstate" in statement]) == 1
+
+
+def test_fresh_database_starts_and_seeds(tmp_path, monkeypatch):
+    monkeypatch.setenv(main.DEV_DEMO_SEED_ENV, "1")
+    monkeypatch.setenv(main.ENVIRONMENT_ENV, "development")
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'fresh.db'}")
+
+    main.on_startup()
+    main.on_startup()
+
+    with Session(main.engine) as session:
+        projects = session.exec(select(main.Project)).all()
+        assert {project.name for project in projects} == {"Website Redesign", "Q4 Marketing Campaign"}
+        assert len(session.exec(select(main.Task)).all()) == 3
+
+
+def test_validate_sqlite_database_path_warns_outside_persistent_roots(tmp_path, caplog):
+    inside = Path(main.DEFAULT_DEV_DB_PATH)
+    with caplog.at_level("WARNING", logger=main.logger.name):
+        assert main.validate_sqlite_database_path(str(inside)) == inside
+    assert "outside known persistent mounts" not in caplog.text
+
+    outside = tmp_path / "portfolio.db"
+    with caplog.at_level("WARNING", logger=main.logger.name):
+        assert main.validate_sqlite_database_path(str(outside)) == outside
+    assert "outside known persistent mounts" in caplog.text
+
+
+def test_upsert_project_replaces_existing_children(tmp_path):
+    db_path = tmp_path / "replace.db"
+    main.engine = main.create_engine_from_env(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(main.engine)
+
+    def payload(subtask_titles, note):
+        return main.ProjectPayload(
+            id="project-replace",
+            name="Replace Children",
+            plan=[
+                main.TaskPayload(
+                    id="task-keep",
+                    title="Task",
+                    assignee=main.AssigneePayload(name="Riley"),
+                    subtasks=[main.SubtaskPayload(title=title) for title in subtask_titles],
+                )
+            ],
+            recentActivity=[main.ActivityPayload(date="2025-01-01", note=note, author="Riley")],
+        )
+
+    with Session(main.engine) as session:
+        main.upsert_project(session, payload(["First", "Second"], "Kickoff"))
+        project = main.upsert_project(session, payload(["Only"], "Replanned"))
+
+        assert [task.id for task in project.plan] == ["task-keep"]
+        assert [subtask.title for subtask in project.plan[0].subtasks] == ["Only"]
+        assert project.plan[0].assignee.name == "Riley"
+        assert [activity.note for activity in project.recentActivity] == ["Replanned"]
+        assert project.lastUpdate == "Replanned"
+        assert len(session.exec(select(main.Subtask)).all()) == 1
+        assert len(session.exec(select(main.Activity)).all()) == 1
+
+
+def test_upsert_project_writes_the_project_row_in_one_statement(tmp_path):
+    from sqlalchemy import event
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'project-upsert.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        session.add(main.Initiative(id="initiative-1", name="Growth"))
+        main.upsert_project(session, main.ProjectPayload(id="project-1", name="Launch", stakeholders=[{"name": "Riley"}]))
+        session.get(main.Project, "project-1").initiative_id = "initiative-1"
+        session.commit()
+
+        stale = session.get(main.Project, "project-1")
+        assert stale.name == "Launch"
+
+        statements = []
+        record = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(main.engine, "before_cursor_execute", record)
+        try:
+            project = main.upsert_project(
+                session,
+                main.ProjectPayload(id="project-1", name="Relaunch", stakeholders=[{"name": "Sam"}], plan=[{"title": "Plan"}]),
+                reload=False,
+            )
+        finally:
+            event.remove(main.engine, "before_cursor_execute", record)
+
+        assert project is None
+        project_writes = [statement for statement in statements if "INTO project " in statement or "UPDATE project" in statement]
+        assert len(project_writes) == 1 and "ON CONFLICT" in project_writes[0]
+        project_reads = [statement for statement in statements if statement.startswith("SELECT") and "FROM project" in statement]
+        assert len(project_reads) == 1 and "lower(project.name)" in project_reads[0]  # only the duplicate-name check
+
+        assert stale.name == "Relaunch"
+        assert stale.initiative_id == "initiative-1"
+        assert [person.name for person in stale.stakeholders] == ["Sam"]
+        assert [task.title for task in stale.plan] == ["Plan"]
+
+    with main.engine.connect() as connection:
+        for query, index_name in (
+            ("DELETE FROM task WHERE task.project_id = ?", "ix_task_project_id"),
+            ("DELETE FROM subtask WHERE subtask.task_id IN (SELECT task.id FROM task WHERE task.project_id = ?)", "ix_subtask_task_id"),
+        ):
+            plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}", ("x",)))
+            assert index_name in plan
+
+
+def test_upsert_project_only_writes_children_that_changed(tmp_path):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'project-diff.db'}")
+    main.create_db_and_tables()
+
+    def payload(first_title="Plan", subtasks=("Draft", "Review"), stakeholders=("Riley", "Sam")):
+        return main.ProjectPayload(
+            id="project-1",
+            name="Launch",
+            stakeholders=[{"name": name} for name in stakeholders],
+            plan=[
+                {"id": "task-1", "title": first_title, "subtasks": [{"id": f"subtask-{title}", "title": title} for title in subtasks]},
+                {"id": "task-2", "title": "Ship"},
+            ],
+            recentActivity=[{"id": "activity-1", "date": "2025-01-01", "note": "Kickoff", "author": "Riley"}],
+        )
+
+    with Session(main.engine) as session:
+        main.upsert_project(session, payload())
+        connection = session.connection().connection.dbapi_connection
+
+        def generation():
+            return connection.execute("SELECT generation FROM portfolio_version").fetchone()[0]
+
+        def rows_written(next_payload):
+            before, generation_before = connection.total_changes, generation()
+            main.upsert_project(session, next_payload, reload=False)
+            # total_changes also counts the portfolio_version bump made at commit
+            return connection.total_changes - before - (generation() - generation_before)
+
+        assert rows_written(payload()) == 0
+        assert rows_written(payload(first_title="Plan v2")) == 1
+        # One subtask and one stakeholder link deleted
+        assert rows_written(payload(first_title="Plan v2", subtasks=("Draft",), stakeholders=("Riley",))) == 2
+
+        project = main.load_project(session, "project-1")
+        assert [task.title for task in project.plan] == ["Plan v2", "Ship"]
+        assert [subtask.id for subtask in project.plan[0].subtasks] == ["subtask-Draft"]
+        assert [person.name for person in project.stakeholders] == ["Riley"]
+        assert [activity.note for activity in project.recentActivity] == ["Kickoff"]
+
+
+def test_reordering_the_plan_and_subtasks_persists(tmp_path):
+    client = _create_test_client(tmp_path)
+
+    def plan(*tasks):
+        return [{"id": task_id, "title": task_id, "subtasks": [{"id": sid, "title": sid} for sid in subtasks]} for task_id, subtasks in tasks]
+
+    project = client.post("/projects", json={"name": "Ordered", "plan": plan(("a", ["a1", "a2"]), ("b", []))}).json()
+    reordered = client.put(
+        f"/projects/{project['id']}", json={"name": "Ordered", "plan": plan(("b", []), ("a", ["a2", "a1"]))}
+    ).json()
+    assert [task["id"] for task in reordered["plan"]] == ["b", "a"]
+    assert [subtask["id"] for subtask in reordered["plan"][1]["subtasks"]] == ["a2", "a1"]
+
+    task = client.put(
+        f"/projects/{project['id']}/tasks/a",
+        json={"title": "a", "subtasks": [{"id": "a1", "title": "a1"}, {"id": "a2", "title": "a2"}]},
+    ).json()
+    assert [subtask["id"] for subtask in task["subtasks"]] == ["a1", "a2"]
+
+    client.post(f"/projects/{project['id']}/tasks", json={"id": "c", "title": "c"})
+    client.post(f"/projects/{project['id']}/tasks/b/subtasks", json={"id": "b1", "title": "b1"})
+    for stored in (client.get(f"/projects/{project['id']}").json(), client.get("/projects").json()[0]):
+        assert [task["id"] for task in stored["plan"]] == ["b", "a", "c"]
+        assert [subtask["id"] for subtask in stored["plan"][1]["subtasks"]] == ["a1", "a2"]
+        assert [subtask["id"] for subtask in stored["plan"][0]["subtasks"]] == ["b1"]
+
+
+def test_project_payload_cannot_take_over_another_projects_rows(tmp_path):
+    client = _create_test_client(tmp_path)
+    owner = client.post(
+        "/projects",
+        json={
+            "name": "Owner",
+            "plan": [{"id": "task-a", "title": "Plan", "subtasks": [{"id": "subtask-a", "title": "Draft"}]}],
+            "recentActivity": [{"id": "activity-a", "date": "2025-01-01", "note": "Kickoff"}],
+        },
+    ).json()
+
+    for payload in (
+        {"name": "Thief", "plan": [{"id": "task-a", "title": "Stolen"}]},
+        {"name": "Thief", "plan": [{"title": "Mine", "subtasks": [{"id": "subtask-a", "title": "Stolen"}]}]},
+        {"name": "Thief", "recentActivity": [{"id": "activity-a", "date": "2025-01-02", "note": "Stolen"}]},
+    ):
+        response = client.post("/projects", json=payload)
+        assert response.status_code == 400
+        assert "belongs to another project" in response.json()["detail"]
+
+    stored = client.get(f"/projects/{owner['id']}").json()
+    assert [task["title"] for task in stored["plan"]] == ["Plan"]
+    assert [subtask["title"] for subtask in stored["plan"][0]["subtasks"]] == ["Draft"]
+    assert [activity["note"] for activity in stored["recentActivity"]] == ["Kickoff"]
+    assert [project["name"] for project in client.get("/projects").json()] == ["Owner"]
+
+
+def test_upsert_project_resolves_activity_authors_in_one_query(tmp_path):
+    from sqlalchemy import event
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'authors.db'}")
+    main.create_db_and_tables()
+
+    with Session(main.engine) as session:
+        session.add(main.Person(id="person-riley", name="Riley"))
+        session.add(main.Person(id="person-sam", name="Sam"))
+        session.commit()
+
+        person_reads = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "FROM person" in statement:
+                person_reads.append(statement)
+
+        payload = main.ProjectPayload(
+            name="Launch",
+            recentActivity=[
+                {"date": "2025-01-01", "note": f"Update {index}", "author": author}
+                for index, author in enumerate(["riley", "person-sam", "Unknown"] * 10)
+            ],
+        )
+        event.listen(main.engine, "before_cursor_execute", record)
+        try:
+            main.upsert_project(session, payload, reload=False)
+        finally:
+            event.remove(main.engine, "before_cursor_execute", record)
+
+        assert len(person_reads) == 1
+        authors = session.exec(select(main.Activity.author, main.Activity.author_id).order_by(main.Activity.note)).all()
+        assert set(authors) == {("Riley", "person-riley"), ("Sam", "person-sam"), ("Unknown", None)}
+
+
+def test_import_resolves_each_repeated_assignee_once(tmp_path, monkeypatch):
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'assignees.db'}")
+    main.create_db_and_tables()
+
+    resolved = []
+    resolve = main.resolve_person_reference
+    monkeypatch.setattr(main, "resolve_person_reference", lambda session, ref: resolved.append(ref) or resolve(session, ref))
+
+    def project(index):
+        return main.ProjectPayload(
+            name=f"Project {index}",
+            plan=[
+                main.TaskPayload(
+                    title=f"Task {task}",
+                    assignee=main.AssigneePayload(name="Pat", team="PMO"),
+                    subtasks=[main.SubtaskPayload(title="Step", assignee=main.AssigneePayload(name="Pat", team="PMO"))],
+                )
+                for task in range(5)
+            ],
+        )
+
+    payload = main.ImportPayload(projects=[project(1), project(2)], mode="replace")
+    with Session(main.engine) as session:
+        main.apply_import(session, payload, request=None)
+
+    assert len(resolved) == 1
+    with Session(main.engine) as session:
+        pat = session.exec(select(main.Person).where(main.Person.name == "Pat")).one()
+        assert {task.assignee_id for task in session.exec(select(main.Task)).all()} == {pat.id}
+        assert {subtask.assignee_id for subtask in session.exec(select(main.Subtask)).all()} == {pat.id}
+
+
+def test_llm_http_client_is_shared_until_shutdown():
+    import asyncio
+
+    client = main.get_llm_http_client()
+    assert main.get_llm_http_client() is client
+
+    asyncio.run(main.close_llm_http_client())
+    assert client.is_closed
+    assert main.get_llm_http_client() is not client
+    asyncio.run(main.close_llm_http_client())
+
+
+def test_sqlite_optimizer_runs_and_stops_with_the_app(tmp_path, monkeypatch):
+    import asyncio
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'optimize.db'}")
+    main.create_db_and_tables()
+    main.optimize_sqlite_database()
+
+    calls = []
+    monkeypatch.setattr(main, "SQLITE_OPTIMIZE_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(main, "optimize_sqlite_database", lambda: calls.append(1))
+
+    async def run_app_lifecycle():
+        await main.start_sqlite_optimizer()
+        task = main._sqlite_optimize_task
+        while not calls:
+            await asyncio.sleep(0.01)
+        await main.stop_sqlite_optimizer()
+        await asyncio.sleep(0)
+        return task
+
+    task = asyncio.run(run_app_lifecycle())
+    assert task.cancelled()
+    assert main._sqlite_optimize_task is None
+
+
+def test_audit_entries_are_batched_by_the_background_writer(tmp_path, monkeypatch):
+    import asyncio
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'audit.db'}")
+    main.create_db_and_tables()
+    batches = []
+    write_audit_entries = main.write_audit_entries
+    monkeypatch.setattr(main, "write_audit_entries", lambda entries: batches.append(len(entries)) or write_audit_entries(entries))
+
+    def log(index):
+        with Session(main.engine) as session:
+            session.add(main.Person(id=f"person-{index}", name=f"Person {index}"))
+            main.log_action(session, "create_person", "person", f"person-{index}", {"index": index})
+
+    async def run_app_lifecycle():
+        await main.start_audit_writer()
+        await asyncio.gather(*(asyncio.to_thread(log, index) for index in range(5)))
+        def etag():
+            with Session(main.engine) as session:
+                return main.portfolio_etag(session)
+
+        before = etag()
+        while not batches:
+            await asyncio.sleep(0.01)
+        assert etag() == before
+        await asyncio.to_thread(log, 5)
+        await main.stop_audit_writer()
+
+    asyncio.run(run_app_lifecycle())
+    assert main._audit_writer_task is None
+    assert sum(batches) == 6
+    assert len(batches) < 6
+
+    with Session(main.engine) as session:
+        assert len(session.exec(select(main.Person)).all()) == 6
+        entries = session.exec(select(main.AuditLog.entity_id, main.AuditLog.details)).all()
+    assert sorted(entries) == sorted((f"person-{index}", json.dumps({"index": index}, separators=(",", ":"))) for index in range(6))
+
+
+def test_audit_writer_survives_failed_batches_and_shutdown(tmp_path, monkeypatch):
+    import asyncio
+
+    from sqlalchemy.exc import OperationalError
+
+    main.engine = main.create_engine_from_env(f"sqlite:///{tmp_path / 'audit-retry.db'}")
+    main.create_db_and_tables()
+    monkeypatch.setattr(main, "AUDIT_BATCH_TIMEOUT_SECONDS", 0.01)
+    attempts = []
+    write_audit_entries = main.write_audit_entries
+
+    def flaky_write(entries):
+        attempts.append([entry["entity_id"] for entry in entries])
+        # The first attempt fails as a locked database would; "poison" never goes in
+        if len(attempts) == 1 or any(entry["entity_id"] == "poison" for entry in entries):
+            raise OperationalError("INSERT INTO auditlog", {}, Exception("database is locked"))
+        write_audit_entries(entries)
+
+    monkeypatch.setattr(main, "write_audit_entries", flaky_write)
+
+    def log(entity_id):
+        with Session(main.engine) as session:
+            main.log_action(session, "touch", "project", entity_id)
+
+    def entry(entity_id):
+        return {
+            "timestamp": "2025-01-01T00:00:00", "action": "touch", "entity_type": "project",
+            "entity_id": entity_id, "details": None, "user_agent": None, "ip_address": None,
+        }
+
+    async def run_app_lifecycle():
+        await main.start_audit_writer()
+        await asyncio.to_thread(log, "first")
+        while not any("first" in batch for batch in attempts[1:]):
+            await asyncio.sleep(0.01)
+        await asyncio.to_thread(log, "poison")
+        await asyncio.to_thread(log, "healthy")
+        # Queued just before shutdown: must be drained, not dropped
+        main.queue_audit_entry(entry("queued"))
+        await main.stop_audit_writer()
+
+    asyncio.run(run_app_lifecycle())
+    # After shutdown entries are written inline
+    main.queue_audit_entry(entry("late"))
+
+    with Session(main.engine) as session:
+        logged = session.exec(select(main.AuditLog.entity_id)).all()
+    assert sorted(logged) == ["first", "healthy", "late", "queued"]
+
+
+def test_serialize_message_matches_model_dump_for_tool_calls():
+    message = main.ChatMessage(
+        role="assistant",
+        tool_calls=[{"id": "call-1", "function": {"name": "lookup", "arguments": "{}"}}],
+    )
+    serialized = main._serialize_message(message)
+    assert serialized == {
+        "role": "assistant",
+        "tool_calls": [tool_call.model_dump() for tool_call in message.tool_calls],
+    }
+
+
+def test_normalize_recipients_splits_on_commas_and_semicolons():
+    assert main.normalize_recipients(" a@x.test; b@x.test ,, c@x.test ") == ["a@x.test", "b@x.test", "c@x.test"]
+    assert main.normalize_recipients(["a@x.test", "", "b@x.test;c@x.test"]) == ["a@x.test", "b@x.test", "c@x.test"]
+    assert main.normalize_recipients(()) == []
+
+
+def test_dispatch_emails_bulk_sends_a_batch_over_one_connection(monkeypatch):
+    connections = []
+
+    class FakeSMTP:
+        def __init__(self, server, port, timeout=None):
+            self.sent = []
+            self.tls_starts = 0
+            connections.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def starttls(self):
+            self.tls_starts += 1
+
+        def send_message(self, message, to_addrs):
+            self.sent.append((message["Subject"], to_addrs))
+            return {address: (550, b"No such user") for address in to_addrs if address.startswith("gone")}
+
+    monkeypatch.setattr(main.smtplib, "SMTP", FakeSMTP)
+    messages = [
+        (main.build_email_message("bot@x.test", [f"user{index}@x.test"], [], f"Digest {index}", "Body"), [f"user{index}@x.test"])
+        for index in range(3)
+    ]
+    messages.append((main.build_email_message("bot@x.test", ["gone@x.test"], [], "Bounce", "Body"), ["gone@x.test"]))
+
+    results = main.dispatch_emails_bulk("smtp.x.test", 25, messages, use_tls=True)
+
+    assert len(connections) == 1
+    assert connections[0].tls_starts == 1
+    assert [subject for subject, _ in connections[0].sent] == ["Digest 0", "Digest 1", "Digest 2", "Bounce"]
+    assert results[0] == {"sent_to": ["user0@x.test"], "refused": []}
+    assert results[3] == {"sent_to": [], "refused": ["gone@x.test"]}
+
+    with pytest.raises(ValueError, match="All recipients refused"):
+        main.dispatch_email("smtp.x.test", 25, "bot@x.test", ["gone@x.test"], [], [], "Bounce", "Body")
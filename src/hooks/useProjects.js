@@ -131,7 +131,7 @@ export const useProjects = ({ personRefForApi } = {}) => {
 
   // Task operations
   const addTask = useCallback(async (projectId, task) => {
-    const updatedProject = await apiRequest(`/projects/${projectId}/tasks`, {
+    const updatedProject = await apiRequest(`/projects/${projectId}/tasks?full=1`, {
       method: 'POST',
       body: JSON.stringify(mapTaskForApi(task))
     });
@@ -139,7 +139,7 @@ export const useProjects = ({ personRefForApi } = {}) => {
   }, [mapTaskForApi, updateProjectFromResponse]);
 
   const updateTask = useCallback(async (projectId, taskId, updates) => {
-    const updatedProject = await apiRequest(`/projects/${projectId}/tasks/${taskId}`, {
+    const updatedProject = await apiRequest(`/projects/${projectId}/tasks/${taskId}?full=1`, {
       method: 'PUT',
       body: JSON.stringify(mapTaskForApi({ ...updates, id: taskId }))
     });
@@ -157,7 +157,7 @@ export const useProjects = ({ personRefForApi } = {}) => {
 
   // Subtask operations
   const addSubtask = useCallback(async (projectId, taskId, subtask) => {
-    const updatedProject = await apiRequest(`/projects/${projectId}/tasks/${taskId}/subtasks`, {
+    const updatedProject = await apiRequest(`/projects/${projectId}/tasks/${taskId}/subtasks?full=1`, {
       method: 'POST',
       body: JSON.stringify(mapSubtaskForApi(subtask))
     });
@@ -165,7 +165,7 @@ export const useProjects = ({ personRefForApi } = {}) => {
   }, [mapSubtaskForApi, updateProjectFromResponse]);
 
   const updateSubtask = useCallback(async (projectId, taskId, subtaskId, updates) => {
-    const updatedProject = await apiRequest(`/projects/${projectId}/tasks/${taskId}/subtasks/${subtaskId}`, {
+    const updatedProject = await apiRequest(`/projects/${projectId}/tasks/${taskId}/subtasks/${subtaskId}?full=1`, {
       method: 'PUT',
       body: JSON.stringify(mapSubtaskForApi({ ...updates, id: subtaskId }))
     });
@@ -190,7 +190,7 @@ export const useProjects = ({ personRefForApi } = {}) => {
 
   // Activity operations
   const addActivity = useCallback(async (projectId, activity) => {
-    const updatedProject = await apiRequest(`/projects/${projectId}/activities`, {
+    const updatedProject = await apiRequest(`/projects/${projectId}/activities?full=1`, {
       method: 'POST',
       body: JSON.stringify(mapActivityForApi(activity))
     });
@@ -198,7 +198,7 @@ export const useProjects = ({ personRefForApi } = {}) => {
   }, [mapActivityForApi, updateProjectFromResponse]);
 
   const updateActivity = useCallback(async (projectId, activityId, updates) => {
-    const updatedProject = await apiRequest(`/projects/${projectId}/activities/${activityId}`, {
+    const updatedProject = await apiRequest(`/projects/${projectId}/activities/${activityId}?full=1`, {
       method: 'PUT',
       body: JSON.stringify(mapActivityForApi({ ...updates, id: activityId }))
     });